@@ -0,0 +1,110 @@
+"""Numeric kernels shared by the analysis modules"""
+from functools import lru_cache
+from typing import Tuple
+import numpy as np
+
+
+def regime_stats(close: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Trend R², return volatility and price change of a close series
+
+    All three statistics share one offset copy of the prices, so the
+    series is shifted once instead of once per metric. The trend R² is
+    closed-form: the x axis is the candle index 0..n-1, so its sums are
+    known analytically. Shifting by the first close keeps the sums well
+    conditioned, since R² is invariant to a constant offset in y.
+
+    Args:
+        close: Contiguous float64 array of close prices
+
+    Returns:
+        Tuple of (trend R², std of simple returns, total price change)
+    """
+    if close.size < 2:
+        return 0.0, 0.0, 0.0
+
+    offsets = close - close[0]
+
+    # Simple returns: diff(offsets) == diff(close)
+    returns = np.diff(offsets)
+    returns /= close[:-1]
+    mean_return = returns.mean()
+    variance = max(np.dot(returns, returns) / returns.size - mean_return * mean_return, 0.0)
+
+    return _offset_r2(offsets), float(np.sqrt(variance)), float(offsets[-1] / close[0])
+
+
+@lru_cache(maxsize=8)
+def _x_axis(n: int) -> Tuple[np.ndarray, float, float]:
+    """
+    Candle index axis x = 0..n-1 and its analytic sums
+
+    Candle counts come from a handful of configured limits, so the
+    axis is built once per n and shared read-only between requests.
+    """
+    x = np.arange(n, dtype=np.float64)
+    x.setflags(write=False)
+    return x, n * (n - 1) / 2.0, (n - 1) * n * (2 * n - 1) / 6.0
+
+
+def _offset_r2(y: np.ndarray) -> float:
+    """R² of a line fitted to prices already offset by their first value"""
+    n = y.size
+    x, sum_x, sum_x2 = _x_axis(n)
+
+    sum_y = y.sum()
+    sum_xy = np.dot(x, y)
+    sum_y2 = np.dot(y, y)
+
+    slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+
+    # Sums of squares from the accumulated moments (no residual array)
+    ss_tot = sum_y2 - sum_y * sum_y / n
+    ss_res = ss_tot - slope * (sum_xy - sum_x * sum_y / n)
+
+    if ss_tot <= 0:
+        return 0.0
+
+    # Keep rounding error in the identity from pushing R² outside [0, 1]
+    ss_res = min(max(ss_res, 0.0), ss_tot)
+
+    return float(1 - ss_res / ss_tot)
+
+
+def max_run_length(mask: np.ndarray, block_size: int = 65536) -> int:
+    """
+    Longest run of consecutive True values in a boolean mask
+
+    Uses a branchless cumulative-reset scan: the run length at each position
+    is the running True count minus its value at the last False. Long masks
+    are scanned in cache-sized blocks, carrying the open run across block
+    boundaries, so temporaries never exceed block_size elements.
+
+    Args:
+        mask: Boolean array (e.g. returns < 0)
+        block_size: Maximum number of elements scanned per block
+
+    Returns:
+        Length of the longest run of True values
+    """
+    best = 0
+    carry = 0
+
+    for start in range(0, mask.size, block_size):
+        block = mask[start:start + block_size].astype(np.int32)
+        running = np.cumsum(block)
+        reset = np.maximum.accumulate(np.where(block == 0, running, 0))
+        run = running - reset
+
+        if block.all():
+            # Whole block extends the run from the previous block
+            carry += block.size
+            best = max(best, carry)
+            continue
+
+        # Values before the first False continue the previous block's run
+        leading = int(np.argmin(block))
+        best = max(best, carry + leading, int(run.max()))
+        carry = int(run[-1])
+
+    return best
@@ -2,6 +2,7 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, Any
+from ._kernels import regime_stats
 
 
 class MarketRegimeAnalyzer:
@@ -21,24 +22,22 @@ class MarketRegimeAnalyzer:
         Args:
             df: DataFrame with OHLCV data (must have 'close' column)
         """
-        self.df = df.copy()
-        self.close = df['close'].values
+        # Only close prices are used, so keep a contiguous float64 array
+        # instead of copying the whole DataFrame
+        self.close = np.ascontiguousarray(df['close'].to_numpy(), dtype=np.float64)
         
     def analyze(self) -> Dict[str, Any]:
         """
         Perform comprehensive market regime analysis
         
         Returns:
-            Dict with regime classification and metrics
+            Dict with regime classification and unrounded metrics
+            (rounding happens in MarketRegimeResponse)
         """
-        # Calculate trend strength
-        trend_strength = self._calculate_trend_strength()
-        
-        # Calculate volatility
-        volatility = self._calculate_volatility()
-        
-        # Calculate price change
-        price_change_pct = (self.close[-1] - self.close[0]) / self.close[0]
+        # Trend, volatility and price change from one shared sweep of close
+        r_squared, return_std, price_change_pct = regime_stats(self.close)
+        trend_strength = abs(r_squared)
+        volatility = self._annualize(return_std)
         
         # Classify regime
         regime = self._classify_regime(trend_strength, volatility)
@@ -48,57 +47,23 @@ class MarketRegimeAnalyzer:
         
         return {
             "regime": regime,
-            "trend_strength": round(trend_strength, 4),
+            "trend_strength": trend_strength,
             "volatility_level": volatility_level,
-            "volatility_value": round(volatility, 4),
-            "price_change_pct": round(price_change_pct, 4)
+            "volatility_value": volatility,
+            "price_change_pct": price_change_pct
         }
     
-    def _calculate_trend_strength(self) -> float:
-        """
-        Calculate trend strength using linear regression R²
-        
-        Returns:
-            Trend strength between 0 and 1
-        """
-        n = len(self.close)
-        x = np.arange(n)
-        
-        # Linear regression
-        slope, intercept = np.polyfit(x, self.close, 1)
-        y_pred = slope * x + intercept
-        
-        # Calculate R² (coefficient of determination)
-        ss_res = np.sum((self.close - y_pred) ** 2)
-        ss_tot = np.sum((self.close - np.mean(self.close)) ** 2)
-        
-        if ss_tot == 0:
-            return 0.0
-        
-        r_squared = 1 - (ss_res / ss_tot)
-        
-        # Return absolute value (trend strength regardless of direction)
-        return abs(r_squared)
-    
-    def _calculate_volatility(self) -> float:
+    def _annualize(self, volatility: float) -> float:
         """
-        Calculate volatility as standard deviation of returns
+        Annualize a per-candle volatility
         
+        Args:
+            volatility: Standard deviation of per-candle returns
+            
         Returns:
-            Volatility (annualized)
+            Annualized volatility (assuming hourly data, 24*365 periods per year)
         """
-        returns = np.diff(self.close) / self.close[:-1]
-        
-        if len(returns) == 0:
-            return 0.0
-        
-        # Standard deviation of returns
-        volatility = np.std(returns)
-        
-        # Annualize (assuming hourly data, 24*365 periods per year)
-        annualized_volatility = volatility * np.sqrt(24 * 365)
-        
-        return annualized_volatility
+        return volatility * np.sqrt(24 * 365)
     
     def _classify_regime(self, trend_strength: float, volatility: float) -> str:
         """
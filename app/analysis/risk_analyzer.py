@@ -1,7 +1,8 @@
 """Risk Analysis - Comprehensive risk metrics for trading strategies"""
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Optional, Union
+from ._kernels import max_run_length
 
 
 class RiskAnalyzer:
@@ -15,23 +16,31 @@ class RiskAnalyzer:
     - Value at Risk (VaR)
     """
     
-    def __init__(self, trades: List[Union[Dict, Any]], initial_capital: float):
+    def __init__(
+        self,
+        trades: List[Union[Dict, Any]],
+        initial_capital: float,
+        returns: Optional[np.ndarray] = None
+    ):
         """
         Initialize risk analyzer
         
         Args:
             trades: List of trades from backtest (dicts or Trade objects)
             initial_capital: Starting capital
+            returns: Optional per-trade returns already extracted from trades,
+                so callers that also compute performance metrics share one array
         """
         self.trades = trades
         self.initial_capital = initial_capital
+        self.returns = returns
         
     def analyze(self) -> Dict[str, Any]:
         """
         Perform comprehensive risk analysis
         
         Returns:
-            Dict with risk metrics
+            Dict with unrounded risk metrics (rounding happens in RiskMetrics)
         """
         if not self.trades:
             # No trades = no risk (but also no profit)
@@ -44,123 +53,132 @@ class RiskAnalyzer:
                 "value_at_risk_95": 0.0
             }
         
-        # Extract returns (handle both dict and object)
-        returns = []
-        for trade in self.trades:
-            if isinstance(trade, dict):
-                # Trades from strategies use 'return' key
-                returns.append(trade.get('return', trade.get('return_pct', 0)))
-            else:
-                # Trade objects use 'return_pct' attribute
-                returns.append(getattr(trade, 'return_pct', getattr(trade, 'return', 0)))
+        # Extract returns once into a float64 array (handle both dict and object)
+        if self.returns is not None:
+            returns = np.asarray(self.returns, dtype=np.float64)
+        else:
+            returns = np.fromiter(
+                (self._trade_return(trade) for trade in self.trades),
+                dtype=np.float64,
+                count=len(self.trades)
+            )
+        
+        # Classify losing trades once and share the mask across loss metrics
+        losing = returns < 0
+        losses = returns[losing]
         
         # Calculate metrics
         return_volatility = self._calculate_return_volatility(returns)
-        max_consecutive_losses = self._calculate_max_consecutive_losses(returns)
-        largest_loss = self._calculate_largest_loss(returns)
-        avg_loss = self._calculate_avg_loss(returns)
+        max_consecutive_losses = self._calculate_max_consecutive_losses(losing)
+        largest_loss = self._calculate_largest_loss(losses)
+        avg_loss = self._calculate_avg_loss(losses)
         var_95 = self._calculate_value_at_risk(returns, confidence=0.95)
         risk_level = self._classify_risk(return_volatility, max_consecutive_losses, largest_loss)
         
         return {
-            "return_volatility": round(return_volatility, 4),
+            "return_volatility": return_volatility,
             "max_consecutive_losses": max_consecutive_losses,
-            "largest_loss": round(largest_loss, 4),
-            "avg_loss": round(avg_loss, 4),
+            "largest_loss": largest_loss,
+            "avg_loss": avg_loss,
             "risk_level": risk_level,
-            "value_at_risk_95": round(var_95, 4)
+            "value_at_risk_95": var_95
         }
     
-    def _calculate_return_volatility(self, returns: List[float]) -> float:
+    @staticmethod
+    def _trade_return(trade: Union[Dict, Any]) -> float:
+        """
+        Get the return of a single trade
+        
+        Args:
+            trade: Trade dict (uses 'return' key) or Trade object (uses 'return_pct')
+            
+        Returns:
+            Trade return
+        """
+        if isinstance(trade, dict):
+            return trade.get('return', trade.get('return_pct', 0))
+        return getattr(trade, 'return_pct', getattr(trade, 'return', 0))
+    
+    def _calculate_return_volatility(self, returns: np.ndarray) -> float:
         """
         Calculate volatility of trade returns
         
         Args:
-            returns: List of trade returns
+            returns: Array of trade returns
             
         Returns:
             Standard deviation of returns
         """
-        if len(returns) < 2:
+        if returns.size < 2:
             return 0.0
         
-        return float(np.std(returns))
+        return float(returns.std())
     
-    def _calculate_max_consecutive_losses(self, returns: List[float]) -> int:
+    def _calculate_max_consecutive_losses(self, losing: np.ndarray) -> int:
         """
         Calculate maximum consecutive losing trades
         
         Args:
-            returns: List of trade returns
+            losing: Boolean mask of losing trades
             
         Returns:
             Maximum consecutive losses
         """
-        max_consecutive = 0
-        current_consecutive = 0
-        
-        for ret in returns:
-            if ret < 0:
-                current_consecutive += 1
-                max_consecutive = max(max_consecutive, current_consecutive)
-            else:
-                current_consecutive = 0
-        
-        return max_consecutive
+        return max_run_length(losing)
     
-    def _calculate_largest_loss(self, returns: List[float]) -> float:
+    def _calculate_largest_loss(self, losses: np.ndarray) -> float:
         """
         Calculate largest single trade loss
         
         Args:
-            returns: List of trade returns
+            losses: Returns of losing trades
             
         Returns:
             Largest loss (negative value)
         """
-        losses = [r for r in returns if r < 0]
-        
-        if not losses:
+        if losses.size == 0:
             return 0.0
         
-        return float(min(losses))
+        return float(losses.min())
     
-    def _calculate_avg_loss(self, returns: List[float]) -> float:
+    def _calculate_avg_loss(self, losses: np.ndarray) -> float:
         """
         Calculate average losing trade
         
         Args:
-            returns: List of trade returns
+            losses: Returns of losing trades
             
         Returns:
             Average loss
         """
-        losses = [r for r in returns if r < 0]
-        
-        if not losses:
+        if losses.size == 0:
             return 0.0
         
-        return float(np.mean(losses))
+        return float(losses.mean())
     
-    def _calculate_value_at_risk(self, returns: List[float], confidence: float = 0.95) -> float:
+    def _calculate_value_at_risk(self, returns: np.ndarray, confidence: float = 0.95) -> float:
         """
         Calculate Value at Risk (VaR)
         
         VaR represents the maximum expected loss at a given confidence level
         
         Args:
-            returns: List of trade returns
+            returns: Array of trade returns
             confidence: Confidence level (e.g., 0.95 for 95%)
             
         Returns:
             VaR value (negative = loss)
         """
-        if len(returns) < 2:
+        if returns.size < 2:
             return 0.0
         
-        # Calculate percentile
-        percentile = (1 - confidence) * 100
-        var = float(np.percentile(returns, percentile))
+        # Percentile with linear interpolation (same as np.percentile), using
+        # an O(n) selection of the two neighbouring order statistics
+        position = (returns.size - 1) * (1 - confidence)
+        lower = int(np.floor(position))
+        upper = min(lower + 1, returns.size - 1)
+        selected = np.partition(returns, (lower, upper))
+        var = float(selected[lower] + (position - lower) * (selected[upper] - selected[lower]))
         
         return var
     
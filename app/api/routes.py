@@ -1,15 +1,31 @@
 """FastAPI route handlers"""
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from cachetools import TTLCache
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
+import asyncio
+import numpy as np
+import pandas as pd
 import logging
+import multiprocessing
+import orjson
+import sys
+import threading
+import time
+from pydantic import BaseModel
 from ..models.schemas import (
     EMABacktestRequest, EMABacktestResponse,
     RSIBacktestRequest, RSIBacktestResponse,
     BacktestResults,
-    ComparisonRequest, ComparisonResponse, StrategyComparisonResult,
+    StrategyConfig, ComparisonRequest, ComparisonResponse, StrategyComparisonResult,
     MarketRegimeResponse,
-    RiskAnalysisRequest, RiskAnalysisResponse, RiskMetrics
+    RiskAnalysisRequest, RiskAnalysisResponse, RiskMetrics,
+    Timeframe
 )
-from ..strategies import EMAStrategy, RSIStrategy
+from ..strategies import Strategy, EMAStrategy, RSIStrategy
 from ..data import InjectiveDataClient, SyntheticDataClient
 from ..core import MetricsCalculator
 from ..analysis import MarketRegimeAnalyzer, RiskAnalyzer
@@ -23,12 +39,20 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+# orjson serializes the nested metric payloads much faster than json.dumps
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# Strategies hold no state, so one shared instance per strategy serves every request
+_STRATEGIES: Dict[str, Strategy] = {
+    "ema_crossover": EMAStrategy(),
+    "rsi_mean_reversion": RSIStrategy()
+}
 
-# Initialize data client based on configuration
+
+# Initialize data client based on configuration (shared across requests)
+@lru_cache(maxsize=1)
 def get_data_client():
-    """Factory function to get appropriate data client"""
+    """Factory function to get appropriate data client, created once per process"""
     if settings.USE_REAL_DATA:
         logger.info("Using InjectiveDataClient for real market data")
         return InjectiveDataClient(network=settings.INJECTIVE_NETWORK)
@@ -37,6 +61,114 @@ def get_data_client():
         return SyntheticDataClient()
 
 
+@router.on_event("shutdown")
+def close_data_client():
+    """Release connections held by the shared data client"""
+    if get_data_client.cache_info().currsize:
+        client = get_data_client()
+        if hasattr(client, "close"):
+            client.close()
+        get_data_client.cache_clear()
+
+
+# Short-lived caches shared across requests
+_CANDLE_CACHE = TTLCache(maxsize=128, ttl=settings.CANDLE_CACHE_TTL)
+_REGIME_CACHE = TTLCache(maxsize=256, ttl=settings.REGIME_CACHE_TTL)
+_cache_lock = threading.Lock()
+
+
+def _cached_candles(market: str, timeframe: str, limit: int) -> Tuple[pd.DataFrame, float]:
+    """
+    Return the cached candle frame and the time it was fetched
+    
+    Candles are cached per (market, timeframe, limit) for CANDLE_CACHE_TTL
+    seconds. The fetch time identifies which fetch a frame came from, so
+    results derived from it can be tied to that exact set of candles.
+    """
+    key = (market, timeframe, limit)
+    with _cache_lock:
+        entry = _CANDLE_CACHE.get(key)
+    
+    if entry is None:
+        df = get_data_client().fetch_historical_candles(
+            market=market,
+            timeframe=timeframe,
+            limit=limit
+        )
+        entry = (df, time.monotonic())
+        with _cache_lock:
+            _CANDLE_CACHE[key] = entry
+    else:
+        logger.info(f"Using cached candles for {market} ({timeframe})")
+    
+    return entry
+
+
+def get_candles(market: str, timeframe: str, limit: int = settings.DEFAULT_CANDLE_LIMIT):
+    """
+    Fetch historical candles, reusing recent results for the same market
+    
+    Repeated backtests within CANDLE_CACHE_TTL seconds don't hit the data
+    client again. Callers get a shallow copy over the client's read-only
+    columns: adding columns never touches the cached frame, and nothing is
+    copied per request.
+    """
+    df, _ = _cached_candles(market, timeframe, limit)
+    return df.copy(deep=False)
+
+
+# Backtest metrics keyed by the fetch time of the candles they came from;
+# a refetch changes the key, so stale metrics are never served
+_BACKTEST_CACHE = TTLCache(maxsize=256, ttl=settings.CANDLE_CACHE_TTL)
+
+
+def run_backtest(
+    strategy: Strategy,
+    market: str,
+    timeframe: str,
+    parameters: Union[Dict[str, Any], BaseModel],
+    initial_capital: float
+) -> Dict[str, Any]:
+    """
+    Backtest a strategy on the cached candles and calculate its metrics
+    
+    Metrics are memoized per (strategy, market, timeframe, parameters,
+    initial_capital) and per candle fetch, so repeating the same backtest
+    skips the indicator pass and the trade simulation while always
+    matching the candles /compare and /risk-analysis currently see.
+    Request parameter models are passed through as-is so the strategy
+    doesn't re-validate what pydantic already checked.
+    
+    Raises:
+        InvalidMarketError: If the market is not supported
+        StrategyExecutionError: If the strategy cannot run on the candles
+        ValueError: If the parameters are invalid
+    
+    Failed backtests are not cached.
+    """
+    params = parameters.model_dump() if isinstance(parameters, BaseModel) else parameters
+    candles, fetched_at = _cached_candles(market, timeframe, settings.DEFAULT_CANDLE_LIMIT)
+    key = (strategy.name, market, timeframe, tuple(sorted(params.items())), initial_capital, fetched_at)
+    with _cache_lock:
+        metrics = _BACKTEST_CACHE.get(key)
+    
+    if metrics is None:
+        df = candles.copy(deep=False)
+        logger.info(f"Fetched {len(df)} candles for {market}")
+        
+        trades = strategy.execute(data=df, parameters=parameters)
+        logger.info(f"{strategy.name} executed: {len(trades)} trades generated")
+        
+        metrics = MetricsCalculator.calculate(trades, initial_capital)
+        with _cache_lock:
+            _BACKTEST_CACHE[key] = metrics
+    else:
+        logger.info(f"Using cached {strategy.name} backtest for {market} ({timeframe})")
+    
+    # Shallow copy so callers can't mutate the cached result
+    return dict(metrics)
+
+
 @router.get("/")
 def root():
     """API root endpoint with information"""
@@ -51,6 +183,7 @@ def root():
             ],
             "advanced": [
                 "/compare",
+                "/compare/stream",
                 "/market-regime",
                 "/risk-analysis"
             ]
@@ -60,7 +193,7 @@ def root():
 
 
 @router.post("/backtest/ema-crossover", response_model=EMABacktestResponse)
-def backtest_ema_crossover(request: EMABacktestRequest):
+async def backtest_ema_crossover(request: EMABacktestRequest):
     """
     Backtest EMA Crossover Strategy
     
@@ -89,31 +222,17 @@ def backtest_ema_crossover(request: EMABacktestRequest):
     try:
         logger.info(f"Backtest request: {request.market} {request.timeframe} with params {request.parameters}")
         
-        # Step 1: Fetch historical data (NO FALLBACK - Real data only)
-        data_client = get_data_client()
-        
-        df = data_client.fetch_historical_candles(
-            market=request.market,
-            timeframe=request.timeframe,
-            limit=settings.DEFAULT_CANDLE_LIMIT
-        )
-        logger.info(f"Fetched {len(df)} candles for {request.market}")
-        
-        # Step 2: Execute strategy
-        strategy = EMAStrategy()
-        trades = strategy.execute(
-            data=df,
-            parameters={
-                'short_period': request.parameters.short_period,
-                'long_period': request.parameters.long_period
-            }
+        # Steps 1-3: Fetch historical data (NO FALLBACK - Real data only),
+        # execute strategy and calculate performance metrics
+        metrics = await run_in_threadpool(
+            run_backtest,
+            _STRATEGIES["ema_crossover"],
+            request.market,
+            request.timeframe,
+            request.parameters,
+            request.initial_capital
         )
         
-        logger.info(f"Strategy executed: {len(trades)} trades generated")
-        
-        # Step 3: Calculate performance metrics
-        metrics = MetricsCalculator.calculate(trades, request.initial_capital)
-        
         logger.info(f"Metrics calculated: {metrics}")
         
         # Step 4: Return results
@@ -150,7 +269,7 @@ def backtest_ema_crossover(request: EMABacktestRequest):
 
 
 @router.post("/backtest/rsi-mean-reversion", response_model=RSIBacktestResponse)
-def backtest_rsi_mean_reversion(request: RSIBacktestRequest):
+async def backtest_rsi_mean_reversion(request: RSIBacktestRequest):
     """
     Backtest RSI Mean Reversion Strategy
     
@@ -179,32 +298,17 @@ def backtest_rsi_mean_reversion(request: RSIBacktestRequest):
     try:
         logger.info(f"RSI Backtest request: {request.market} {request.timeframe} with params {request.parameters}")
         
-        # Step 1: Fetch historical data
-        data_client = get_data_client()
-        
-        df = data_client.fetch_historical_candles(
-            market=request.market,
-            timeframe=request.timeframe,
-            limit=settings.DEFAULT_CANDLE_LIMIT
-        )
-        logger.info(f"Fetched {len(df)} candles for {request.market}")
-        
-        # Step 2: Execute RSI strategy
-        strategy = RSIStrategy()
-        trades = strategy.execute(
-            data=df,
-            parameters={
-                'period': request.parameters.period,
-                'oversold': request.parameters.oversold,
-                'overbought': request.parameters.overbought
-            }
+        # Steps 1-3: Fetch historical data, execute RSI strategy and
+        # calculate performance metrics
+        metrics = await run_in_threadpool(
+            run_backtest,
+            _STRATEGIES["rsi_mean_reversion"],
+            request.market,
+            request.timeframe,
+            request.parameters,
+            request.initial_capital
         )
         
-        logger.info(f"RSI Strategy executed: {len(trades)} trades generated")
-        
-        # Step 3: Calculate performance metrics
-        metrics = MetricsCalculator.calculate(trades, request.initial_capital)
-        
         logger.info(f"Metrics calculated: {metrics}")
         
         # Step 4: Return results
@@ -244,8 +348,106 @@ def backtest_rsi_mean_reversion(request: RSIBacktestRequest):
 # ADVANCED APIS
 # ============================================================
 
+# Process pool for CPU-bound /compare backtests (created on first use)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _init_worker_logging() -> None:
+    """Apply the app's logging config in a /compare worker process"""
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format=settings.LOG_FORMAT,
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool, creating it on first use
+    
+    Workers start from a forkserver rather than a fork of this process:
+    by first use uvicorn's threadpool and the cache lock already exist,
+    and forking with live threads can leave children holding their locks.
+    Forkserver children don't inherit the parent's logging setup, so each
+    worker applies it on start.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            logger.info(f"Starting process pool with {settings.COMPARE_WORKERS} workers")
+            _process_pool = ProcessPoolExecutor(
+                max_workers=settings.COMPARE_WORKERS,
+                mp_context=multiprocessing.get_context("forkserver"),
+                initializer=_init_worker_logging
+            )
+        return _process_pool
+
+
+@router.on_event("shutdown")
+def shutdown_process_pool():
+    """Stop the /compare worker processes"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+def _run_comparison_strategy(
+    index: int,
+    total: int,
+    close: np.ndarray,
+    strategy_config: StrategyConfig,
+    initial_capital: float
+) -> Optional[StrategyComparisonResult]:
+    """
+    Backtest a single strategy configuration for /compare
+    
+    Runs in a worker process, so it must stay a picklable top-level function.
+    Only the close column is shipped to the worker, since that is all the
+    strategies read; it is wrapped back into a frame without copying.
+    
+    Returns:
+        Comparison result, or None if the strategy could not be executed
+    """
+    try:
+        # Select strategy
+        if strategy_config.strategy == "ema_crossover":
+            strategy = _STRATEGIES["ema_crossover"]
+            strategy_name = f"ema_{strategy_config.parameters.get('short_period')}_{strategy_config.parameters.get('long_period')}"
+        elif strategy_config.strategy == "rsi_mean_reversion":
+            strategy = _STRATEGIES["rsi_mean_reversion"]
+            strategy_name = f"rsi_{strategy_config.parameters.get('period')}_{strategy_config.parameters.get('oversold')}_{strategy_config.parameters.get('overbought')}"
+        else:
+            logger.warning(f"Unknown strategy: {strategy_config.strategy}")
+            return None
+        
+        # Execute strategy
+        df = pd.DataFrame({'close': close}, copy=False)
+        trades = strategy.execute(data=df, parameters=strategy_config.parameters)
+        
+        # Calculate metrics
+        metrics = MetricsCalculator.calculate(trades, initial_capital)
+        
+        logger.info(f"Strategy {index+1}/{total}: {strategy_name} - Return: {metrics['total_return']:.2%}")
+        
+        return StrategyComparisonResult(
+            strategy_name=strategy_name,
+            win_rate=metrics['win_rate'],
+            total_return=metrics['total_return'],
+            sharpe_ratio=metrics['sharpe_ratio'],
+            max_drawdown=metrics['max_drawdown'],
+            total_trades=metrics['total_trades']
+        )
+    
+    except Exception as e:
+        logger.error(f"Error executing strategy {index+1}: {e}")
+        return None
+
+
 @router.post("/compare", response_model=ComparisonResponse)
-def compare_strategies(request: ComparisonRequest):
+async def compare_strategies(request: ComparisonRequest):
     """
     Compare Multiple Strategy Configurations
     
@@ -272,54 +474,22 @@ def compare_strategies(request: ComparisonRequest):
         logger.info(f"Strategy comparison request: {request.market} with {len(request.strategies)} strategies")
         
         # Fetch market data once (shared by all strategies)
-        data_client = get_data_client()
-        df = data_client.fetch_historical_candles(
-            market=request.market,
-            timeframe=request.timeframe,
-            limit=settings.DEFAULT_CANDLE_LIMIT
-        )
+        df = await run_in_threadpool(get_candles, request.market, request.timeframe)
         
         logger.info(f"Fetched {len(df)} candles for comparison")
         
-        # Run each strategy
-        comparison_results = []
-        
-        for i, strategy_config in enumerate(request.strategies):
-            try:
-                # Select strategy
-                if strategy_config.strategy == "ema_crossover":
-                    strategy = EMAStrategy()
-                    strategy_name = f"ema_{strategy_config.parameters.get('short_period')}_{strategy_config.parameters.get('long_period')}"
-                elif strategy_config.strategy == "rsi_mean_reversion":
-                    strategy = RSIStrategy()
-                    strategy_name = f"rsi_{strategy_config.parameters.get('period')}_{strategy_config.parameters.get('oversold')}_{strategy_config.parameters.get('overbought')}"
-                else:
-                    logger.warning(f"Unknown strategy: {strategy_config.strategy}")
-                    continue
-                
-                # Execute strategy
-                trades = strategy.execute(data=df, parameters=strategy_config.parameters)
-                
-                # Calculate metrics
-                metrics = MetricsCalculator.calculate(trades, request.initial_capital)
-                
-                # Add to comparison
-                comparison_results.append(
-                    StrategyComparisonResult(
-                        strategy_name=strategy_name,
-                        win_rate=metrics['win_rate'],
-                        total_return=metrics['total_return'],
-                        sharpe_ratio=metrics['sharpe_ratio'],
-                        max_drawdown=metrics['max_drawdown'],
-                        total_trades=metrics['total_trades']
-                    )
-                )
-                
-                logger.info(f"Strategy {i+1}/{len(request.strategies)}: {strategy_name} - Return: {metrics['total_return']:.2%}")
-                
-            except Exception as e:
-                logger.error(f"Error executing strategy {i+1}: {e}")
-                continue
+        # Run all strategies in parallel worker processes on the shared closes
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        total = len(request.strategies)
+        close = df['close'].to_numpy()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(
+                pool, _run_comparison_strategy, i, total, close, strategy_config, request.initial_capital
+            )
+            for i, strategy_config in enumerate(request.strategies)
+        ])
+        comparison_results = [result for result in results if result is not None]
         
         if not comparison_results:
             raise HTTPException(status_code=400, detail="No strategies could be executed successfully")
@@ -345,8 +515,81 @@ def compare_strategies(request: ComparisonRequest):
         raise HTTPException(status_code=500, detail="Internal server error occurred")
 
 
+@router.post("/compare/stream")
+async def compare_strategies_stream(request: ComparisonRequest):
+    """
+    Compare Multiple Strategy Configurations (streamed)
+    
+    Same input as /compare, but results are streamed as newline-delimited
+    JSON (application/x-ndjson) in the order strategies finish, so fast
+    configurations are visible without waiting for the slowest one.
+    
+    Each line is a strategy result. The final line is a summary:
+        {"market": ..., "timeframe": ..., "best_strategy": ...}
+    
+    best_strategy is null if no strategy could be executed.
+    
+    Raises:
+        404: Market not found
+        500: Internal server error
+    """
+    try:
+        logger.info(f"Streaming strategy comparison request: {request.market} with {len(request.strategies)} strategies")
+        
+        # Fetch market data once (shared by all strategies)
+        df = await run_in_threadpool(get_candles, request.market, request.timeframe)
+    
+    except InvalidMarketError as e:
+        logger.error(f"Invalid market: {e}")
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    except Exception as e:
+        logger.exception(f"Unexpected error during comparison: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error occurred")
+    
+    loop = asyncio.get_running_loop()
+    pool = get_process_pool()
+    total = len(request.strategies)
+    close = df['close'].to_numpy()
+    futures = [
+        loop.run_in_executor(
+            pool, _run_comparison_strategy, i, total, close, strategy_config, request.initial_capital
+        )
+        for i, strategy_config in enumerate(request.strategies)
+    ]
+    
+    async def stream_results():
+        best_strategy = None
+        
+        try:
+            for future in asyncio.as_completed(futures):
+                result = await future
+                if result is None:
+                    continue
+                
+                if best_strategy is None or result.total_return > best_strategy.total_return:
+                    best_strategy = result
+                
+                yield orjson.dumps(result.model_dump()) + b"\n"
+            
+            logger.info(f"Streaming comparison complete. Best strategy: {best_strategy.strategy_name if best_strategy else None}")
+            
+            yield orjson.dumps({
+                "market": request.market,
+                "timeframe": request.timeframe,
+                "best_strategy": best_strategy.strategy_name if best_strategy else None
+            }) + b"\n"
+        
+        finally:
+            # Client went away mid-stream: drop backtests it will never read
+            for future in futures:
+                future.cancel()
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.get("/market-regime", response_model=MarketRegimeResponse)
-def analyze_market_regime(market: str, timeframe: str = "1h"):
+async def analyze_market_regime(market: str, timeframe: Timeframe = "1h"):
     """
     Analyze Market Regime
     
@@ -369,26 +612,32 @@ def analyze_market_regime(market: str, timeframe: str = "1h"):
         Market regime classification and metrics
     
     Raises:
-        400: Invalid parameters
         404: Market not found
+        422: Unsupported timeframe
         500: Internal server error
     """
     try:
         logger.info(f"Market regime analysis request: {market} {timeframe}")
         
-        # Fetch market data
-        data_client = get_data_client()
-        df = data_client.fetch_historical_candles(
-            market=market,
-            timeframe=timeframe,
-            limit=settings.DEFAULT_CANDLE_LIMIT
-        )
-        
-        logger.info(f"Fetched {len(df)} candles for regime analysis")
-        
-        # Analyze regime
-        analyzer = MarketRegimeAnalyzer(df)
-        regime_data = analyzer.analyze()
+        key = (market, timeframe)
+        with _cache_lock:
+            regime_data = _REGIME_CACHE.get(key)
+        
+        if regime_data is None:
+            # Fetch market data
+            df = await run_in_threadpool(get_candles, market, timeframe)
+            
+            logger.info(f"Fetched {len(df)} candles for regime analysis")
+            
+            # Analyze regime
+            analyzer = MarketRegimeAnalyzer(df)
+            regime_data = await run_in_threadpool(analyzer.analyze)
+            
+            with _cache_lock:
+                _REGIME_CACHE[key] = regime_data
+        
+        # Shallow copy so callers can't mutate the cached result
+        regime_data = dict(regime_data)
         
         logger.info(f"Regime analysis complete: {regime_data['regime']}")
         
@@ -408,7 +657,7 @@ def analyze_market_regime(market: str, timeframe: str = "1h"):
 
 
 @router.post("/risk-analysis", response_model=RiskAnalysisResponse)
-def analyze_risk(request: RiskAnalysisRequest):
+async def analyze_risk(request: RiskAnalysisRequest):
     """
     Comprehensive Risk Analysis
     
@@ -441,33 +690,30 @@ def analyze_risk(request: RiskAnalysisRequest):
         logger.info(f"Risk analysis request: {request.strategy} on {request.market}")
         
         # Fetch market data
-        data_client = get_data_client()
-        df = data_client.fetch_historical_candles(
-            market=request.market,
-            timeframe=request.timeframe,
-            limit=settings.DEFAULT_CANDLE_LIMIT
-        )
+        df = await run_in_threadpool(get_candles, request.market, request.timeframe)
         
         logger.info(f"Fetched {len(df)} candles for risk analysis")
         
         # Execute strategy
         if request.strategy == "ema_crossover":
-            strategy = EMAStrategy()
+            strategy = _STRATEGIES["ema_crossover"]
         elif request.strategy == "rsi_mean_reversion":
-            strategy = RSIStrategy()
+            strategy = _STRATEGIES["rsi_mean_reversion"]
         else:
             raise HTTPException(status_code=400, detail=f"Unknown strategy: {request.strategy}")
         
-        trades = strategy.execute(data=df, parameters=request.parameters)
+        trades = await run_in_threadpool(strategy.execute, data=df, parameters=request.parameters)
         
         logger.info(f"Strategy executed: {len(trades)} trades")
         
-        # Calculate performance metrics (for reference)
-        performance_metrics = MetricsCalculator.calculate(trades, request.initial_capital)
-        
-        # Analyze risk
-        risk_analyzer = RiskAnalyzer(trades, request.initial_capital)
-        risk_data = risk_analyzer.analyze()
+        # Extract the returns column once; performance metrics (for reference)
+        # and risk metrics both read it, concurrently on the threadpool
+        returns = np.fromiter((trade['return'] for trade in trades), dtype=np.float64, count=len(trades))
+        risk_analyzer = RiskAnalyzer(trades, request.initial_capital, returns=returns)
+        performance_metrics, risk_data = await asyncio.gather(
+            run_in_threadpool(MetricsCalculator.calculate_from_returns, returns, request.initial_capital),
+            run_in_threadpool(risk_analyzer.analyze)
+        )
         
         logger.info(f"Risk analysis complete: Risk Level = {risk_data['risk_level']}")
         
@@ -16,6 +16,29 @@ class MetricsCalculator:
             trades: List of trade dictionaries with 'return' key
             initial_capital: Starting portfolio value
             
+        Returns:
+            Metrics dictionary (see calculate_from_returns)
+        """
+        returns = np.fromiter(
+            (trade['return'] for trade in trades),
+            dtype=np.float64,
+            count=len(trades)
+        )
+        
+        return MetricsCalculator.calculate_from_returns(returns, initial_capital)
+    
+    @staticmethod
+    def calculate_from_returns(returns: np.ndarray, initial_capital: float) -> Dict[str, float]:
+        """
+        Calculate performance metrics from an array of per-trade returns
+        
+        Use this when trade returns are already a NumPy column, so no
+        list of trade dicts has to be built just to read them back.
+        
+        Args:
+            returns: Per-trade returns in trade order
+            initial_capital: Starting portfolio value
+            
         Returns:
             Dictionary containing:
             - win_rate: Percentage of profitable trades
@@ -24,7 +47,9 @@ class MetricsCalculator:
             - sharpe_ratio: Risk-adjusted return
             - total_trades: Number of completed trades
         """
-        if len(trades) == 0:
+        returns = np.asarray(returns, dtype=np.float64)
+        
+        if returns.size == 0:
             return {
                 'win_rate': 0.0,
                 'total_return': 0.0,
@@ -34,41 +59,37 @@ class MetricsCalculator:
             }
         
         # 1. Win Rate
-        winning_trades = sum(1 for trade in trades if trade['return'] > 0)
-        win_rate = winning_trades / len(trades) if len(trades) > 0 else 0
+        win_rate = (returns > 0).mean()
         
-        # 2. Total Return (compounded)
-        capital = initial_capital
-        equity_curve = [capital]
+        # 2. Total Return (compounded), equity curve starts at initial capital.
+        # The curve is written into one preallocated buffer instead of
+        # concatenating a scaled cumprod onto the starting value.
+        equity_curve = np.empty(returns.size + 1)
+        equity_curve[0] = 1.0
+        np.cumprod(1 + returns, out=equity_curve[1:])
+        equity_curve *= initial_capital
+        total_return = (equity_curve[-1] - initial_capital) / initial_capital
         
-        for trade in trades:
-            capital *= (1 + trade['return'])
-            equity_curve.append(capital)
-        
-        total_return = (capital - initial_capital) / initial_capital
-        
-        # 3. Max Drawdown
-        peak = equity_curve[0]
-        max_drawdown = 0
-        
-        for value in equity_curve:
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak if peak > 0 else 0
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
+        # 3. Max Drawdown: the running peak is scanned once, and the deepest
+        # drawdown is the smallest equity/peak ratio (peaks <= 0 count as 0)
+        peaks = np.maximum.accumulate(equity_curve)
+        ratios = np.divide(equity_curve, peaks, out=np.ones_like(peaks), where=peaks > 0)
+        max_drawdown = 1.0 - ratios.min()
         
         # 4. Sharpe Ratio
-        returns = [trade['return'] for trade in trades]
-        if len(returns) > 1 and np.std(returns) > 0:
-            sharpe_ratio = np.mean(returns) / np.std(returns)
+        std = returns.std()
+        if returns.size > 1 and std > 0:
+            sharpe_ratio = returns.mean() / std
         else:
             sharpe_ratio = 0.0
         
+        # Round all four metrics in one vectorized call
+        rounded = np.round([win_rate, total_return, max_drawdown, sharpe_ratio], 4)
+        
         return {
-            'win_rate': round(win_rate, 4),
-            'total_return': round(total_return, 4),
-            'max_drawdown': round(max_drawdown, 4),
-            'sharpe_ratio': round(sharpe_ratio, 4),
-            'total_trades': len(trades)
+            'win_rate': float(rounded[0]),
+            'total_return': float(rounded[1]),
+            'max_drawdown': float(rounded[2]),
+            'sharpe_ratio': float(rounded[3]),
+            'total_trades': int(returns.size)
         }
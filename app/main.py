@@ -13,7 +13,7 @@ from config import settings
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=settings.LOG_FORMAT,
     handlers=[
         logging.StreamHandler(sys.stdout)
     ]
@@ -1,6 +1,13 @@
 """Pydantic schemas for API requests and responses"""
-from pydantic import BaseModel, Field, field_validator
-from typing import Dict, Optional
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+from typing import Annotated, Dict, Literal, Optional
+
+# Supported candle timeframes; Literal checks reject anything else at parse time
+Timeframe = Literal["1m", "5m", "15m", "1h", "4h", "1d"]
+
+# Shared constrained types, so every request model reuses one pattern definition
+MarketPair = Annotated[str, StringConstraints(pattern=r'^[A-Z]+/[A-Z]+(\s+[A-Z]+)?$')]
+StrategyName = Annotated[str, StringConstraints(pattern=r'^(ema_crossover|rsi_mean_reversion)$')]
 
 
 class EMAParameters(BaseModel):
@@ -19,14 +26,16 @@ class EMAParameters(BaseModel):
 
 class EMABacktestRequest(BaseModel):
     """Request body for EMA Crossover backtest"""
-    market: str = Field(..., pattern=r'^[A-Z]+/[A-Z]+(\s+[A-Z]+)?$', description="Market pair (e.g., INJ/USDT, INJ/USDT PERP)")
-    timeframe: str = Field(..., pattern=r'^(1m|5m|15m|1h|4h|1d)$', description="Candle timeframe")
+    market: MarketPair = Field(..., description="Market pair (e.g., INJ/USDT, INJ/USDT PERP)")
+    timeframe: Timeframe = Field(..., description="Candle timeframe")
     parameters: EMAParameters
     initial_capital: float = Field(default=1000.0, gt=0, description="Starting capital (must be positive)")
 
 
 class BacktestResults(BaseModel):
     """Performance metrics from backtest"""
+    model_config = ConfigDict(frozen=True)
+    
     win_rate: float = Field(..., ge=0, le=1, description="Percentage of winning trades")
     total_return: float = Field(..., description="Total portfolio return")
     max_drawdown: float = Field(..., ge=0, le=1, description="Maximum drawdown percentage")
@@ -36,6 +45,8 @@ class BacktestResults(BaseModel):
 
 class EMABacktestResponse(BaseModel):
     """Response from EMA Crossover backtest"""
+    model_config = ConfigDict(frozen=True)
+    
     strategy: str
     market: str
     timeframe: str
@@ -59,14 +70,16 @@ class RSIParameters(BaseModel):
 
 class RSIBacktestRequest(BaseModel):
     """Request body for RSI Mean Reversion backtest"""
-    market: str = Field(..., pattern=r'^[A-Z]+/[A-Z]+(\s+[A-Z]+)?$', description="Market pair (e.g., INJ/USDT, INJ/USDT PERP)")
-    timeframe: str = Field(..., pattern=r'^(1m|5m|15m|1h|4h|1d)$', description="Candle timeframe")
+    market: MarketPair = Field(..., description="Market pair (e.g., INJ/USDT, INJ/USDT PERP)")
+    timeframe: Timeframe = Field(..., description="Candle timeframe")
     parameters: RSIParameters
     initial_capital: float = Field(default=1000.0, gt=0, description="Starting capital (must be positive)")
 
 
 class RSIBacktestResponse(BaseModel):
     """Response from RSI Mean Reversion backtest"""
+    model_config = ConfigDict(frozen=True)
+    
     strategy: str
     market: str
     timeframe: str
@@ -88,20 +101,22 @@ class Trade(BaseModel):
 
 class StrategyConfig(BaseModel):
     """Individual strategy configuration for comparison"""
-    strategy: str = Field(..., pattern=r'^(ema_crossover|rsi_mean_reversion)$', description="Strategy type")
+    strategy: StrategyName = Field(..., description="Strategy type")
     parameters: Dict = Field(..., description="Strategy parameters")
 
 
 class ComparisonRequest(BaseModel):
     """Request body for strategy comparison"""
-    market: str = Field(..., pattern=r'^[A-Z]+/[A-Z]+(\s+[A-Z]+)?$', description="Market pair")
-    timeframe: str = Field(..., pattern=r'^(1m|5m|15m|1h|4h|1d)$', description="Candle timeframe")
+    market: MarketPair = Field(..., description="Market pair")
+    timeframe: Timeframe = Field(..., description="Candle timeframe")
     strategies: list[StrategyConfig] = Field(..., min_length=2, max_length=10, description="List of strategies to compare (2-10)")
     initial_capital: float = Field(default=1000.0, gt=0, description="Starting capital")
 
 
 class StrategyComparisonResult(BaseModel):
     """Result for a single strategy in comparison"""
+    model_config = ConfigDict(frozen=True)
+    
     strategy_name: str
     win_rate: float
     total_return: float
@@ -112,6 +127,8 @@ class StrategyComparisonResult(BaseModel):
 
 class ComparisonResponse(BaseModel):
     """Response from strategy comparison"""
+    model_config = ConfigDict(frozen=True)
+    
     market: str
     timeframe: str
     comparison: list[StrategyComparisonResult]
@@ -124,6 +141,8 @@ class ComparisonResponse(BaseModel):
 
 class MarketRegimeResponse(BaseModel):
     """Response from market regime analysis"""
+    model_config = ConfigDict(frozen=True)
+    
     market: str
     timeframe: str
     regime: str = Field(..., pattern=r'^(Trending|Ranging|Volatile)$', description="Market regime classification")
@@ -131,6 +150,12 @@ class MarketRegimeResponse(BaseModel):
     volatility_level: str = Field(..., pattern=r'^(Low|Medium|High)$', description="Volatility classification")
     volatility_value: float = Field(..., ge=0, description="Actual volatility percentage")
     price_change_pct: float = Field(..., description="Price change over period")
+    
+    @field_validator('trend_strength', 'volatility_value', 'price_change_pct')
+    @classmethod
+    def round_metrics(cls, v):
+        """Round metrics to 4 decimals for the wire format"""
+        return round(v, 4)
 
 
 # ============================================================
@@ -139,25 +164,35 @@ class MarketRegimeResponse(BaseModel):
 
 class RiskAnalysisRequest(BaseModel):
     """Request body for risk analysis"""
-    market: str = Field(..., pattern=r'^[A-Z]+/[A-Z]+(\s+[A-Z]+)?$', description="Market pair")
-    timeframe: str = Field(..., pattern=r'^(1m|5m|15m|1h|4h|1d)$', description="Candle timeframe")
-    strategy: str = Field(..., pattern=r'^(ema_crossover|rsi_mean_reversion)$', description="Strategy type")
+    market: MarketPair = Field(..., description="Market pair")
+    timeframe: Timeframe = Field(..., description="Candle timeframe")
+    strategy: StrategyName = Field(..., description="Strategy type")
     parameters: Dict = Field(..., description="Strategy parameters")
     initial_capital: float = Field(default=1000.0, gt=0, description="Starting capital")
 
 
 class RiskMetrics(BaseModel):
     """Risk metrics from strategy analysis"""
+    model_config = ConfigDict(frozen=True)
+    
     return_volatility: float = Field(..., ge=0, description="Volatility of returns")
     max_consecutive_losses: int = Field(..., ge=0, description="Maximum consecutive losing trades")
     largest_loss: float = Field(..., le=0, description="Largest single trade loss")
     avg_loss: float = Field(..., le=0, description="Average losing trade")
     risk_level: str = Field(..., pattern=r'^(Low|Medium|High)$', description="Overall risk classification")
     value_at_risk_95: float = Field(..., description="95% Value at Risk")
+    
+    @field_validator('return_volatility', 'largest_loss', 'avg_loss', 'value_at_risk_95')
+    @classmethod
+    def round_metrics(cls, v):
+        """Round metrics to 4 decimals for the wire format"""
+        return round(v, 4)
 
 
 class RiskAnalysisResponse(BaseModel):
     """Response from risk analysis"""
+    model_config = ConfigDict(frozen=True)
+    
     strategy: str
     market: str
     timeframe: str
@@ -19,7 +19,8 @@ class Strategy(ABC):
         
         Args:
             data: DataFrame with OHLCV data (must have 'close' column minimum)
-            parameters: Strategy-specific parameters
+            parameters: Strategy-specific parameters (dict or validated
+                pydantic parameter model)
             
         Returns:
             List of trade dictionaries with keys:
@@ -1,9 +1,11 @@
 """EMA Crossover Strategy Implementation"""
-from typing import Dict, List
+from typing import Dict, List, Union
+import numpy as np
 import pandas as pd
 import logging
 from .base import Strategy
 from ..core.exceptions import StrategyExecutionError
+from ..models.schemas import EMAParameters
 
 logger = logging.getLogger(__name__)
 
@@ -29,19 +31,23 @@ class EMAStrategy(Strategy):
     def description(self) -> str:
         return "EMA Crossover Strategy using Golden Cross and Death Cross signals"
     
-    def execute(self, data: pd.DataFrame, parameters: Dict) -> List[Dict]:
+    def execute(self, data: pd.DataFrame, parameters: Union[Dict, EMAParameters]) -> List[Dict]:
         """
         Execute EMA Crossover strategy on historical data
         
         Args:
             data: DataFrame with 'close' column
-            parameters: Dict with 'short_period' and 'long_period'
+            parameters: Dict with 'short_period' and 'long_period', or an already
+                validated EMAParameters model
             
         Returns:
             List of completed trades
         """
-        # Validate inputs
-        self.validate_parameters(parameters)
+        # Validate inputs; a EMAParameters model was already validated by pydantic
+        if isinstance(parameters, EMAParameters):
+            parameters = parameters.model_dump()
+        else:
+            self.validate_parameters(parameters)
         
         if 'close' not in data.columns:
             raise StrategyExecutionError("Data must contain 'close' column")
@@ -51,11 +57,13 @@ class EMAStrategy(Strategy):
                 f"Insufficient data: need at least {parameters['long_period']} candles"
             )
         
-        # Calculate EMAs
-        df = self._calculate_ema(data.copy(), parameters['short_period'], parameters['long_period'])
+        # Calculate EMAs on the close array; the input frame is only read, never copied
+        close = data['close'].to_numpy(dtype=np.float64)
+        ema_short = self._ema(close, parameters['short_period'])
+        ema_long = self._ema(close, parameters['long_period'])
         
         # Detect crossovers and simulate trades
-        trades = self._simulate_trades(df)
+        trades = self._simulate_trades(close, ema_short, ema_long)
         
         logger.info(f"EMA Strategy executed: {len(trades)} trades generated")
         return trades
@@ -111,12 +119,23 @@ class EMAStrategy(Strategy):
         
         Using pandas ewm() for efficient calculation.
         """
-        df['ema_short'] = df['close'].ewm(span=short_period, adjust=False).mean()
-        df['ema_long'] = df['close'].ewm(span=long_period, adjust=False).mean()
+        close = df['close'].to_numpy(dtype=np.float64)
+        df['ema_short'] = self._ema(close, short_period)
+        df['ema_long'] = self._ema(close, long_period)
         
         return df
     
-    def _simulate_trades(self, df: pd.DataFrame) -> List[Dict]:
+    @staticmethod
+    def _ema(close: np.ndarray, period: int) -> np.ndarray:
+        """EMA of a close array (pandas ewm with span=period, adjust=False)"""
+        return pd.Series(close, copy=False).ewm(span=period, adjust=False).mean().to_numpy()
+    
+    def _simulate_trades(
+        self,
+        close: np.ndarray,
+        ema_short: np.ndarray,
+        ema_long: np.ndarray
+    ) -> List[Dict]:
         """
         Simulate trades based on EMA crossover signals
         
@@ -125,44 +144,51 @@ class EMAStrategy(Strategy):
         
         Sell Signal (Death Cross):
         - Short EMA crosses BELOW Long EMA
+        
+        Crossovers are detected with vectorized masks over the EMA spread;
+        only the sparse crossover indices are walked to pair entries with exits.
         """
-        trades = []
-        position_open = False
-        entry_price = 0
-        entry_index = 0
-        
-        for i in range(1, len(df)):
-            current_short = df['ema_short'].iloc[i]
-            current_long = df['ema_long'].iloc[i]
-            prev_short = df['ema_short'].iloc[i-1]
-            prev_long = df['ema_long'].iloc[i-1]
-            current_price = df['close'].iloc[i]
-            
-            # Skip if EMAs are NaN (initial period)
-            if pd.isna(current_short) or pd.isna(current_long):
-                continue
+        spread = ema_short - ema_long
+        
+        # One byte-per-bar side mask each; a cross is a bar on the side whose
+        # previous bar was not (ewm with adjust=False has no NaN warm-up)
+        above = spread > 0
+        below = spread < 0
+        golden = np.flatnonzero(above[1:] > above[:-1]) + 1
+        death = np.flatnonzero(below[1:] > below[:-1]) + 1
+        
+        # Open on the next golden cross while flat, close on the next death cross
+        debug = logger.isEnabledFor(logging.DEBUG)
+        entries = []
+        exits = []
+        g = 0
+        while g < golden.size:
+            entry_index = int(golden[g])
+            d = np.searchsorted(death, entry_index)
+            if d == death.size:
+                break
             
-            # Buy Signal: Golden Cross
-            if not position_open and current_short > current_long and prev_short <= prev_long:
-                position_open = True
-                entry_price = current_price
-                entry_index = i
-                logger.debug(f"Golden Cross at index {i}: Entry at {entry_price}")
+            exit_index = int(death[d])
+            entries.append(entry_index)
+            exits.append(exit_index)
+            if debug:
+                logger.debug(f"Golden Cross at index {entry_index}, Death Cross at index {exit_index}")
             
-            # Sell Signal: Death Cross
-            elif position_open and current_short < current_long and prev_short >= prev_long:
-                exit_price = current_price
-                trade_return = (exit_price - entry_price) / entry_price
-                
-                trades.append({
-                    'entry_price': entry_price,
-                    'exit_price': exit_price,
-                    'return': trade_return,
-                    'entry_index': entry_index,
-                    'exit_index': i
-                })
-                
-                logger.debug(f"Death Cross at index {i}: Exit at {exit_price}, Return: {trade_return:.2%}")
-                position_open = False
-        
-        return trades
+            g = np.searchsorted(golden, exit_index)
+        
+        entry_prices = close[entries]
+        exit_prices = close[exits]
+        returns = (exit_prices - entry_prices) / entry_prices
+        
+        return [
+            {
+                'entry_price': entry_price,
+                'exit_price': exit_price,
+                'return': trade_return,
+                'entry_index': entry_index,
+                'exit_index': exit_index
+            }
+            for entry_price, exit_price, trade_return, entry_index, exit_index in zip(
+                entry_prices.tolist(), exit_prices.tolist(), returns.tolist(), entries, exits
+            )
+        ]
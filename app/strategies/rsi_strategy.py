@@ -1,9 +1,11 @@
 """RSI Mean Reversion Strategy Implementation"""
-from typing import Dict, List
+from typing import Dict, List, Union
+import numpy as np
 import pandas as pd
 import logging
 from .base import Strategy
 from ..core.exceptions import StrategyExecutionError
+from ..models.schemas import RSIParameters
 
 logger = logging.getLogger(__name__)
 
@@ -30,19 +32,23 @@ class RSIStrategy(Strategy):
     def description(self) -> str:
         return "RSI Mean Reversion Strategy using oversold/overbought levels"
     
-    def execute(self, data: pd.DataFrame, parameters: Dict) -> List[Dict]:
+    def execute(self, data: pd.DataFrame, parameters: Union[Dict, RSIParameters]) -> List[Dict]:
         """
         Execute RSI Mean Reversion strategy on historical data
         
         Args:
             data: DataFrame with 'close' column
-            parameters: Dict with 'period', 'oversold', and 'overbought'
+            parameters: Dict with 'period', 'oversold', and 'overbought', or an already
+                validated RSIParameters model
             
         Returns:
             List of completed trades
         """
-        # Validate inputs
-        self.validate_parameters(parameters)
+        # Validate inputs; a RSIParameters model was already validated by pydantic
+        if isinstance(parameters, RSIParameters):
+            parameters = parameters.model_dump()
+        else:
+            self.validate_parameters(parameters)
         
         if 'close' not in data.columns:
             raise StrategyExecutionError("Data must contain 'close' column")
@@ -52,12 +58,14 @@ class RSIStrategy(Strategy):
                 f"Insufficient data: need at least {parameters['period'] + 1} candles"
             )
         
-        # Calculate RSI
-        df = self._calculate_rsi(data.copy(), parameters['period'])
+        # Calculate RSI on the close array; the input frame is only read, never copied
+        close = data['close'].to_numpy(dtype=np.float64)
+        rsi = self._rsi(close, parameters['period'])
         
         # Detect signals and simulate trades
         trades = self._simulate_trades(
-            df, 
+            close,
+            rsi,
             parameters['oversold'], 
             parameters['overbought']
         )
@@ -126,26 +134,35 @@ class RSIStrategy(Strategy):
         - RSI > 70: Overbought (potential sell)
         - RSI < 30: Oversold (potential buy)
         """
-        # Calculate price changes
-        delta = df['close'].diff()
+        df['rsi'] = self._rsi(df['close'].to_numpy(dtype=np.float64), period)
         
-        # Separate gains and losses
-        gains = delta.where(delta > 0, 0)
-        losses = -delta.where(delta < 0, 0)
+        return df
+    
+    @staticmethod
+    def _rsi(close: np.ndarray, period: int) -> np.ndarray:
+        """RSI of a close array (see _calculate_rsi)"""
+        # Calculate price changes (the first candle has none)
+        delta = np.diff(close, prepend=close[:1])
+        
+        # Separate gains and losses, side by side so one ewm call averages both
+        changes = np.empty((close.size, 2))
+        np.maximum(delta, 0, out=changes[:, 0])
+        np.negative(delta, out=delta)
+        np.maximum(delta, 0, out=changes[:, 1])
         
         # Calculate exponential moving average of gains and losses
-        avg_gain = gains.ewm(span=period, adjust=False).mean()
-        avg_loss = losses.ewm(span=period, adjust=False).mean()
+        averages = pd.DataFrame(changes, copy=False).ewm(span=period, adjust=False).mean().to_numpy()
         
-        # Calculate RS and RSI
-        rs = avg_gain / avg_loss
-        df['rsi'] = 100 - (100 / (1 + rs))
+        # Calculate RS and RSI (no losses -> RSI 100, no movement at all -> NaN)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = averages[:, 0] / averages[:, 1]
         
-        return df
+        return 100 - (100 / (1 + rs))
     
     def _simulate_trades(
         self, 
-        df: pd.DataFrame, 
+        close: np.ndarray,
+        rsi: np.ndarray,
         oversold: float, 
         overbought: float
     ) -> List[Dict]:
@@ -159,68 +176,73 @@ class RSIStrategy(Strategy):
         - RSI crosses ABOVE overbought threshold (profit taking)
         OR
         - RSI crosses below a mid-level if holding (stop loss)
+        
+        Crossings are found with vectorized masks; only the sparse signal
+        indices are walked to pair each entry with its first exit.
         """
-        trades = []
-        position_open = False
-        entry_price = 0
-        entry_index = 0
-        
-        for i in range(1, len(df)):
-            current_rsi = df['rsi'].iloc[i]
-            prev_rsi = df['rsi'].iloc[i-1]
-            current_price = df['close'].iloc[i]
-            
-            # Skip if RSI is NaN (initial period)
-            if pd.isna(current_rsi) or pd.isna(prev_rsi):
-                continue
-            
-            # Buy Signal: RSI crosses below oversold level
-            if not position_open and current_rsi < oversold and prev_rsi >= oversold:
-                position_open = True
-                entry_price = current_price
-                entry_index = i
+        # Threshold crossings as sparse index arrays; NaN RSI compares False
+        current = rsi[1:]
+        previous = rsi[:-1]
+        buys = np.flatnonzero((current < oversold) & (previous >= oversold)) + 1
+        overbought_exits = np.flatnonzero((current > overbought) & (previous <= overbought)) + 1
+        mid_exits = np.flatnonzero((current < 50) & (previous >= 50)) + 1
+        
+        # Walk from signal to signal: enter on the next oversold cross while flat,
+        # exit on whichever exit signal comes first after the entry
+        debug = logger.isEnabledFor(logging.DEBUG)
+        entries = []
+        exits = []
+        exit_reasons = []
+        b = 0
+        while b < buys.size:
+            entry_index = int(buys[b])
+            if debug:
                 logger.debug(
-                    f"RSI Oversold at index {i}: RSI={current_rsi:.2f}, Entry at {entry_price}"
+                    f"RSI Oversold at index {entry_index}: RSI={rsi[entry_index]:.2f}, Entry at {close[entry_index]}"
                 )
             
-            # Sell Signal: RSI crosses above overbought level (take profit)
-            elif position_open and current_rsi > overbought and prev_rsi <= overbought:
-                exit_price = current_price
-                trade_return = (exit_price - entry_price) / entry_price
-                
-                trades.append({
-                    'entry_price': entry_price,
-                    'exit_price': exit_price,
-                    'return': trade_return,
-                    'entry_index': entry_index,
-                    'exit_index': i,
-                    'exit_reason': 'overbought'
-                })
-                
-                logger.debug(
-                    f"RSI Overbought at index {i}: RSI={current_rsi:.2f}, "
-                    f"Exit at {exit_price}, Return: {trade_return:.2%}"
-                )
-                position_open = False
+            o = np.searchsorted(overbought_exits, entry_index, side='right')
+            m = np.searchsorted(mid_exits, entry_index + 5, side='right')
+            overbought_index = int(overbought_exits[o]) if o < overbought_exits.size else None
+            mid_index = int(mid_exits[m]) if m < mid_exits.size else None
             
-            # Alternative exit: RSI crosses back below 50 (mid-level stop)
-            elif position_open and current_rsi < 50 and prev_rsi >= 50 and i > entry_index + 5:
-                exit_price = current_price
-                trade_return = (exit_price - entry_price) / entry_price
-                
-                trades.append({
-                    'entry_price': entry_price,
-                    'exit_price': exit_price,
-                    'return': trade_return,
-                    'entry_index': entry_index,
-                    'exit_index': i,
-                    'exit_reason': 'mid_level_exit'
-                })
-                
+            if overbought_index is None and mid_index is None:
+                break
+            
+            if mid_index is None or (overbought_index is not None and overbought_index < mid_index):
+                exit_index, exit_reason = overbought_index, 'overbought'
+            else:
+                exit_index, exit_reason = mid_index, 'mid_level_exit'
+            
+            entries.append(entry_index)
+            exits.append(exit_index)
+            exit_reasons.append(exit_reason)
+            
+            if debug:
+                trade_return = (close[exit_index] - close[entry_index]) / close[entry_index]
                 logger.debug(
-                    f"RSI Mid-level exit at index {i}: RSI={current_rsi:.2f}, "
-                    f"Exit at {exit_price}, Return: {trade_return:.2%}"
+                    f"RSI {exit_reason} at index {exit_index}: RSI={rsi[exit_index]:.2f}, "
+                    f"Exit at {close[exit_index]}, Return: {trade_return:.2%}"
                 )
-                position_open = False
-        
-        return trades
+            
+            b = np.searchsorted(buys, exit_index, side='right')
+        
+        # Prices and returns for all trades at once; tolist() converts to
+        # Python floats in one call instead of one float() per field
+        entry_prices = close[entries]
+        exit_prices = close[exits]
+        returns = (exit_prices - entry_prices) / entry_prices
+        
+        return [
+            {
+                'entry_price': entry_price,
+                'exit_price': exit_price,
+                'return': trade_return,
+                'entry_index': entry_index,
+                'exit_index': exit_index,
+                'exit_reason': exit_reason
+            }
+            for entry_price, exit_price, trade_return, entry_index, exit_index, exit_reason in zip(
+                entry_prices.tolist(), exit_prices.tolist(), returns.tolist(), entries, exits, exit_reasons
+            )
+        ]
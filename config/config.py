@@ -1,10 +1,18 @@
 """Configuration settings for NinjaQuant API"""
 import os
-from typing import Literal
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Literal
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings"""
+    """
+    Application settings
+    
+    Environment variables are read once when the settings are built;
+    the instance is immutable afterwards.
+    """
     
     # API Configuration
     APP_TITLE: str = "NinjaQuant API"
@@ -12,21 +20,41 @@ class Settings:
     APP_VERSION: str = "1.0.0"
     
     # Injective Network Configuration
-    INJECTIVE_NETWORK: Literal["mainnet", "testnet"] = os.getenv("INJECTIVE_NETWORK", "mainnet")
+    INJECTIVE_NETWORK: Literal["mainnet", "testnet"] = field(
+        default_factory=lambda: os.getenv("INJECTIVE_NETWORK", "mainnet")
+    )
     
     # Data Client Configuration
-    USE_REAL_DATA: bool = os.getenv("USE_REAL_DATA", "true").lower() == "true"
-    DATA_FETCH_TIMEOUT: int = int(os.getenv("DATA_FETCH_TIMEOUT", "10"))
+    USE_REAL_DATA: bool = field(
+        default_factory=lambda: os.getenv("USE_REAL_DATA", "true").lower() == "true"
+    )
+    DATA_FETCH_TIMEOUT: int = field(default_factory=lambda: int(os.getenv("DATA_FETCH_TIMEOUT", "10")))
     DEFAULT_CANDLE_LIMIT: int = 500
     
+    # Cache Configuration (seconds)
+    CANDLE_CACHE_TTL: int = field(default_factory=lambda: int(os.getenv("CANDLE_CACHE_TTL", "60")))
+    REGIME_CACHE_TTL: int = field(default_factory=lambda: int(os.getenv("REGIME_CACHE_TTL", "30")))
+    
+    # Worker processes used by /compare
+    COMPARE_WORKERS: int = field(
+        default_factory=lambda: int(os.getenv("COMPARE_WORKERS", str(min(8, os.cpu_count() or 1))))
+    )
+    
     # CORS Configuration
-    CORS_ORIGINS: list = ["*"]
+    CORS_ORIGINS: List[str] = field(default_factory=lambda: ["*"])
     CORS_CREDENTIALS: bool = True
-    CORS_METHODS: list = ["*"]
-    CORS_HEADERS: list = ["*"]
+    CORS_METHODS: List[str] = field(default_factory=lambda: ["*"])
+    CORS_HEADERS: List[str] = field(default_factory=lambda: ["*"])
     
     # Logging Configuration
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance"""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
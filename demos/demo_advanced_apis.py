@@ -7,11 +7,21 @@ a professional-grade quantitative trading platform.
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 BASE_URL = "http://localhost:8000"
 
+# (connect, read) seconds, so a hung server can't stall the demo
+REQUEST_TIMEOUT = (5, 30)
+
+# One keep-alive session so every demo call reuses the same connection
+SESSION = requests.Session()
+# Concurrent calls wait for a pooled connection instead of opening extra sockets
+SESSION.mount("http://", HTTPAdapter(pool_maxsize=10, pool_block=True))
+
 
 def print_header(title: str):
     """Print formatted section header"""
@@ -22,7 +32,7 @@ def print_header(title: str):
 
 def print_result(result: Dict[Any, Any]):
     """Print formatted JSON result"""
-    print(json.dumps(result, indent=2))
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
 
 
 def test_strategy_comparison():
@@ -67,10 +77,10 @@ def test_strategy_comparison():
     print("   - EMA(12,26)")
     print("   - RSI(14,30,70)")
     
-    response = requests.post(f"{BASE_URL}/compare", json=request_body)
+    response = SESSION.post(f"{BASE_URL}/compare", json=request_body, timeout=REQUEST_TIMEOUT)
     
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         print("\n✅ RESULTS:")
         print(f"\n🏆 Best Strategy: {result['best_strategy']}")
         print(f"\n📈 Performance Comparison:")
@@ -97,14 +107,20 @@ def test_market_regime():
     
     print("\n📊 Analyzing market regimes for all markets...")
     
-    for market in markets:
-        response = requests.get(
+    # The three lookups are independent, so fetch them together
+    def get_regime(market):
+        return SESSION.get(
             f"{BASE_URL}/market-regime",
-            params={"market": market, "timeframe": "1h"}
+            params={"market": market, "timeframe": "1h"},
+            timeout=REQUEST_TIMEOUT
         )
-        
+    
+    with ThreadPoolExecutor(max_workers=len(markets)) as pool:
+        responses = list(pool.map(get_regime, markets))
+    
+    for market, response in zip(markets, responses):
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"\n   {market}:")
             print(f"      Regime: {result['regime']}")
             print(f"      Trend Strength: {result['trend_strength']:.4f}")
@@ -143,10 +159,10 @@ def test_risk_analysis():
     
     print("\n📊 Analyzing risk for RSI strategy on ETH/USDT PERP...")
     
-    response = requests.post(f"{BASE_URL}/risk-analysis", json=request_body)
+    response = SESSION.post(f"{BASE_URL}/risk-analysis", json=request_body, timeout=REQUEST_TIMEOUT)
     
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         risk = result['risk_metrics']
         perf = result['performance_summary']
         
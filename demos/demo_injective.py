@@ -6,58 +6,43 @@ and validates markets against the actual blockchain.
 """
 
 import requests
-import json
-import time
+from requests.adapters import HTTPAdapter
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
 API_BASE = "http://localhost:8000"
 
+# (connect, read) seconds, so a hung server can't stall the demo
+REQUEST_TIMEOUT = (5, 30)
+
+# One keep-alive session so every demo call reuses the same connection
+SESSION = requests.Session()
+# Concurrent calls wait for a pooled connection instead of opening extra sockets
+SESSION.mount("http://", HTTPAdapter(pool_maxsize=10, pool_block=True))
+
 def print_section(title):
     """Print formatted section header"""
     print(f"\n{'='*60}")
     print(f"  {title}")
     print(f"{'='*60}\n")
 
-def test_injective_integration():
-    """Test real Injective blockchain integration"""
-    
-    print_section("🚀 INJECTIVE BLOCKCHAIN INTEGRATION DEMO")
-    
-    # Test 1: Check API is using real data
-    print("📡 Checking API configuration...")
-    response = requests.get(f"{API_BASE}/")
-    config = response.json()
-    print(f"✅ API Version: {config['version']}")
-    print(f"✅ Data Mode: {config['data_mode'].upper()}")
-    print(f"✅ Endpoints: {', '.join(config['endpoints'])}")
-    
-    time.sleep(1)
-    
-    # Test 2: Backtest with INJ/USDT PERP (real Injective market)
-    print_section("🔍 Testing Real Injective Market: INJ/USDT PERP")
-    
-    payload = {
-        "market": "INJ/USDT PERP",
-        "timeframe": "1h",
-        "parameters": {
-            "short_period": 12,
-            "long_period": 26
-        },
-        "initial_capital": 10000
-    }
-    
-    print("📤 Sending backtest request...")
-    print(f"   Market: {payload['market']}")
-    print(f"   Timeframe: {payload['timeframe']}")
-    print(f"   EMA Periods: {payload['parameters']['short_period']}/{payload['parameters']['long_period']}")
-    
-    response = requests.post(
+def post_backtest(payload):
+    """Send one EMA crossover backtest request"""
+    return SESSION.post(
         f"{API_BASE}/backtest/ema-crossover",
         json=payload,
-        headers={"Content-Type": "application/json"}
+        headers={"Content-Type": "application/json"},
+        timeout=REQUEST_TIMEOUT
     )
+
+def print_backtest(payload, response):
+    """Print the request summary and results of one backtest"""
+    print(f"   Market: {payload['market']}")
+    print(f"   Timeframe: {payload['timeframe']}")
+    print(f"   EMA Periods: {payload['parameters']['short_period']}/{payload['parameters']['long_period']}")
     
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         print(f"\n✅ Successfully backtested {result['market']}!")
         print(f"\n📊 Results:")
         print(f"   Win Rate: {result['results']['win_rate']:.1%}")
@@ -68,58 +53,63 @@ def test_injective_integration():
     else:
         print(f"❌ Error: {response.status_code}")
         print(response.text)
+
+def test_injective_integration():
+    """Test real Injective blockchain integration"""
     
-    time.sleep(1)
-    
-    # Test 3: Backtest with BTC/USDT PERP (another real Injective market)
-    print_section("🔍 Testing Real Injective Market: BTC/USDT PERP")
+    print_section("🚀 INJECTIVE BLOCKCHAIN INTEGRATION DEMO")
     
-    payload["market"] = "BTC/USDT PERP"
-    payload["parameters"]["short_period"] = 9
-    payload["parameters"]["long_period"] = 21
+    # Test 1: Check API is using real data
+    print("📡 Checking API configuration...")
+    response = SESSION.get(f"{API_BASE}/", timeout=REQUEST_TIMEOUT)
+    config = orjson.loads(response.content)
+    print(f"✅ API Version: {config['version']}")
+    print(f"✅ Data Mode: {config['data_mode'].upper()}")
+    print(f"✅ Endpoints: {', '.join(config['endpoints'])}")
     
-    print("📤 Sending backtest request...")
-    print(f"   Market: {payload['market']}")
-    print(f"   Timeframe: {payload['timeframe']}")
-    print(f"   EMA Periods: {payload['parameters']['short_period']}/{payload['parameters']['long_period']}")
+    # Tests 2-4 are independent, so send all three backtests at once and
+    # wait for the slowest instead of the sum of the round trips
+    payloads = [
+        {
+            "market": "INJ/USDT PERP",
+            "timeframe": "1h",
+            "parameters": {"short_period": 12, "long_period": 26},
+            "initial_capital": 10000
+        },
+        {
+            "market": "BTC/USDT PERP",
+            "timeframe": "1h",
+            "parameters": {"short_period": 9, "long_period": 21},
+            "initial_capital": 10000
+        },
+        {
+            "market": "FAKE/MARKET PERP",
+            "timeframe": "1h",
+            "parameters": {"short_period": 9, "long_period": 21},
+            "initial_capital": 10000
+        }
+    ]
+    
+    print(f"\n📤 Sending {len(payloads)} backtest requests concurrently...")
+    with ThreadPoolExecutor(max_workers=len(payloads)) as pool:
+        inj_response, btc_response, invalid_response = pool.map(post_backtest, payloads)
     
-    response = requests.post(
-        f"{API_BASE}/backtest/ema-crossover",
-        json=payload,
-        headers={"Content-Type": "application/json"}
-    )
+    # Test 2: Backtest with INJ/USDT PERP (real Injective market)
+    print_section("🔍 Testing Real Injective Market: INJ/USDT PERP")
+    print_backtest(payloads[0], inj_response)
     
-    if response.status_code == 200:
-        result = response.json()
-        print(f"\n✅ Successfully backtested {result['market']}!")
-        print(f"\n📊 Results:")
-        print(f"   Win Rate: {result['results']['win_rate']:.1%}")
-        print(f"   Total Return: {result['results']['total_return']:.1%}")
-        print(f"   Max Drawdown: {result['results']['max_drawdown']:.1%}")
-        print(f"   Sharpe Ratio: {result['results']['sharpe_ratio']:.2f}")
-        print(f"   Total Trades: {result['results']['total_trades']}")
-    else:
-        print(f"❌ Error: {response.status_code}")
-        print(response.text)
+    # Test 3: Backtest with BTC/USDT PERP (another real Injective market)
+    print_section("🔍 Testing Real Injective Market: BTC/USDT PERP")
+    print_backtest(payloads[1], btc_response)
     
     # Test 4: Try invalid market (should fail)
     print_section("🔍 Testing Invalid Market (should fail)")
+    print(f"   Market: {payloads[2]['market']}")
     
-    payload["market"] = "FAKE/MARKET PERP"
-    
-    print("📤 Sending backtest request with invalid market...")
-    print(f"   Market: {payload['market']}")
-    
-    response = requests.post(
-        f"{API_BASE}/backtest/ema-crossover",
-        json=payload,
-        headers={"Content-Type": "application/json"}
-    )
-    
-    if response.status_code != 200:
+    if invalid_response.status_code != 200:
         print(f"\n✅ Correctly rejected invalid market!")
-        print(f"   Status: {response.status_code}")
-        error = response.json()
+        print(f"   Status: {invalid_response.status_code}")
+        error = orjson.loads(invalid_response.content)
         if 'detail' in error:
             print(f"   Error: {error['detail']}")
     else:
@@ -1,9 +1,23 @@
 """Test RSI Strategy API Endpoint"""
+import argparse
+import itertools
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
 
 API_URL = "http://localhost:8000"
+RSI_ENDPOINT = "/backtest/rsi-mean-reversion"
+EMA_ENDPOINT = "/backtest/ema-crossover"
+
+# One keep-alive session so every demo call reuses the same connection
+SESSION = requests.Session()
+# Concurrent calls wait for a pooled connection instead of opening extra sockets
+SESSION.mount("http://", HTTPAdapter(pool_maxsize=10, pool_block=True))
+
+# Request bodies are pre-encoded with orjson and sent as raw JSON bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 def test_rsi_endpoint():
@@ -35,14 +49,10 @@ def test_rsi_endpoint():
     print()
     
     try:
-        response = requests.post(
-            f"{API_URL}/backtest/rsi-mean-reversion",
-            json=payload,
-            timeout=30
-        )
+        response = SESSION.post(f"{API_URL}{RSI_ENDPOINT}", data=orjson.dumps(payload), headers=JSON_HEADERS, timeout=30)
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print("✅ API Response: SUCCESS")
             print()
             print(f"Strategy: {data['strategy']}")
@@ -77,6 +87,55 @@ def test_rsi_endpoint():
         print(f"❌ Error: {e}")
 
 
+def post_backtest(endpoint, payload):
+    """Send one backtest request, returning the response or the error"""
+    try:
+        return SESSION.post(f"{API_URL}{endpoint}", data=payload, headers=JSON_HEADERS, timeout=30)
+    except Exception as e:
+        return e
+
+
+def post_backtests(backtests, max_workers=10):
+    """Send independent (endpoint, payload) backtests concurrently, results in order"""
+    with ThreadPoolExecutor(max_workers=min(len(backtests), max_workers)) as pool:
+        return list(pool.map(lambda backtest: post_backtest(*backtest), backtests))
+
+
+def backtest_payload(market, parameters, timeframe="1h", initial_capital=1000.0):
+    """JSON-encoded request body for a backtest endpoint"""
+    return orjson.dumps({
+        "market": market,
+        "timeframe": timeframe,
+        "parameters": parameters,
+        "initial_capital": initial_capital
+    })
+
+
+def print_summary(response, format_results):
+    """Print one formatted result line, or the error for a failed request"""
+    if isinstance(response, Exception):
+        print(f"   ❌ Error: {response}")
+    elif response.status_code == 200:
+        print(format_results(orjson.loads(response.content)['results']))
+    else:
+        print(f"   ❌ Error: {response.status_code}")
+
+
+def format_market_results(results):
+    """One-line win rate / return / trades summary"""
+    return (f"   ✅ Win Rate: {results['win_rate']*100:.1f}% | "
+            f"Return: {results['total_return']*100:+.2f}% | "
+            f"Trades: {results['total_trades']}")
+
+
+def format_strategy_results(results):
+    """One-line return / win rate / trades / Sharpe summary"""
+    return (f"   Return: {results['total_return']*100:+.2f}% | "
+            f"Win Rate: {results['win_rate']*100:.1f}% | "
+            f"Trades: {results['total_trades']} | "
+            f"Sharpe: {results['sharpe_ratio']:.2f}")
+
+
 def test_multiple_markets():
     """Test RSI strategy with multiple Injective markets"""
     print("=" * 70)
@@ -89,39 +148,12 @@ def test_multiple_markets():
         "BTC/USDT PERP",
         "ETH/USDT PERP"
     ]
+    parameters = {"period": 14, "oversold": 30, "overbought": 70}
     
-    for market in markets:
+    responses = post_backtests([(RSI_ENDPOINT, backtest_payload(market, parameters)) for market in markets])
+    for market, response in zip(markets, responses):
         print(f"\n📊 Testing {market}...")
-        
-        payload = {
-            "market": market,
-            "timeframe": "1h",
-            "parameters": {
-                "period": 14,
-                "oversold": 30,
-                "overbought": 70
-            },
-            "initial_capital": 1000.0
-        }
-        
-        try:
-            response = requests.post(
-                f"{API_URL}/backtest/rsi-mean-reversion",
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                results = data['results']
-                print(f"   ✅ Win Rate: {results['win_rate']*100:.1f}% | "
-                      f"Return: {results['total_return']*100:+.2f}% | "
-                      f"Trades: {results['total_trades']}")
-            else:
-                print(f"   ❌ Error: {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+        print_summary(response, format_market_results)
 
 
 def test_different_parameters():
@@ -133,46 +165,20 @@ def test_different_parameters():
     print()
     
     parameter_sets = [
-        {"period": 7, "oversold": 30, "overbought": 70, "name": "Fast RSI (7)"},
-        {"period": 14, "oversold": 30, "overbought": 70, "name": "Standard RSI (14)"},
-        {"period": 21, "oversold": 30, "overbought": 70, "name": "Slow RSI (21)"},
-        {"period": 14, "oversold": 20, "overbought": 80, "name": "Wide Bands (20/80)"},
-        {"period": 14, "oversold": 40, "overbought": 60, "name": "Tight Bands (40/60)"},
+        ("Fast RSI (7)", {"period": 7, "oversold": 30, "overbought": 70}),
+        ("Standard RSI (14)", {"period": 14, "oversold": 30, "overbought": 70}),
+        ("Slow RSI (21)", {"period": 21, "oversold": 30, "overbought": 70}),
+        ("Wide Bands (20/80)", {"period": 14, "oversold": 20, "overbought": 80}),
+        ("Tight Bands (40/60)", {"period": 14, "oversold": 40, "overbought": 60}),
     ]
     
-    for params in parameter_sets:
-        print(f"\n🔧 {params['name']}...")
-        
-        payload = {
-            "market": "INJ/USDT PERP",
-            "timeframe": "1h",
-            "parameters": {
-                "period": params['period'],
-                "oversold": params['oversold'],
-                "overbought": params['overbought']
-            },
-            "initial_capital": 1000.0
-        }
-        
-        try:
-            response = requests.post(
-                f"{API_URL}/backtest/rsi-mean-reversion",
-                json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                results = data['results']
-                print(f"   Return: {results['total_return']*100:+.2f}% | "
-                      f"Win Rate: {results['win_rate']*100:.1f}% | "
-                      f"Trades: {results['total_trades']} | "
-                      f"Sharpe: {results['sharpe_ratio']:.2f}")
-            else:
-                print(f"   ❌ Error: {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+    responses = post_backtests([
+        (RSI_ENDPOINT, backtest_payload("INJ/USDT PERP", parameters))
+        for _, parameters in parameter_sets
+    ])
+    for (name, _), response in zip(parameter_sets, responses):
+        print(f"\n🔧 {name}...")
+        print_summary(response, format_strategy_results)
 
 
 def compare_ema_vs_rsi():
@@ -188,78 +194,85 @@ def compare_ema_vs_rsi():
     initial_capital = 1000.0
     
     print(f"Market: {market} | Timeframe: {timeframe}")
-    print()
     
-    # Test EMA
-    print("📊 EMA Crossover Strategy...")
-    ema_payload = {
-        "market": market,
-        "timeframe": timeframe,
-        "parameters": {"short_period": 9, "long_period": 21},
-        "initial_capital": initial_capital
-    }
+    strategies = [
+        ("EMA Crossover Strategy", EMA_ENDPOINT, {"short_period": 9, "long_period": 21}),
+        ("RSI Mean Reversion Strategy", RSI_ENDPOINT, {"period": 14, "oversold": 30, "overbought": 70}),
+    ]
     
-    try:
-        ema_response = requests.post(
-            f"{API_URL}/backtest/ema-crossover",
-            json=ema_payload,
-            timeout=30
-        )
-        
-        if ema_response.status_code == 200:
-            ema_data = ema_response.json()
-            ema_results = ema_data['results']
-            print(f"   Return: {ema_results['total_return']*100:+.2f}% | "
-                  f"Win Rate: {ema_results['win_rate']*100:.1f}% | "
-                  f"Trades: {ema_results['total_trades']} | "
-                  f"Sharpe: {ema_results['sharpe_ratio']:.2f}")
-        else:
-            print(f"   ❌ Error: {ema_response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
+    responses = post_backtests([
+        (endpoint, backtest_payload(market, parameters, timeframe, initial_capital))
+        for _, endpoint, parameters in strategies
+    ])
+    for (name, _, _), response in zip(strategies, responses):
+        print()
+        print(f"📊 {name}...")
+        print_summary(response, format_strategy_results)
     
-    # Test RSI
     print()
-    print("📊 RSI Mean Reversion Strategy...")
-    rsi_payload = {
-        "market": market,
-        "timeframe": timeframe,
-        "parameters": {"period": 14, "oversold": 30, "overbought": 70},
-        "initial_capital": initial_capital
-    }
+
+
+def sweep_ema_parameters():
+    """Sweep EMA period pairs concurrently and rank them by Sharpe ratio"""
+    print("=" * 70)
+    print("🧮 EMA Parameter Sweep")
+    print("=" * 70)
+    print()
     
-    try:
-        rsi_response = requests.post(
-            f"{API_URL}/backtest/rsi-mean-reversion",
-            json=rsi_payload,
-            timeout=30
-        )
-        
-        if rsi_response.status_code == 200:
-            rsi_data = rsi_response.json()
-            rsi_results = rsi_data['results']
-            print(f"   Return: {rsi_results['total_return']*100:+.2f}% | "
-                  f"Win Rate: {rsi_results['win_rate']*100:.1f}% | "
-                  f"Trades: {rsi_results['total_trades']} | "
-                  f"Sharpe: {rsi_results['sharpe_ratio']:.2f}")
-        else:
-            print(f"   ❌ Error: {rsi_response.status_code}")
-    except Exception as e:
-        print(f"   ❌ Error: {e}")
+    grid = [
+        (short, long)
+        for short, long in itertools.product([5, 9, 12, 20], [13, 21, 26, 50])
+        if short < long
+    ]
+    print(f"Testing {len(grid)} EMA pairs on INJ/USDT PERP (up to 10 in flight)...")
+    
+    responses = post_backtests([
+        (EMA_ENDPOINT, backtest_payload("INJ/USDT PERP", {"short_period": short, "long_period": long}))
+        for short, long in grid
+    ])
+    
+    ranked = []
+    for (short, long), response in zip(grid, responses):
+        if isinstance(response, Exception) or response.status_code != 200:
+            continue
+        ranked.append((f"EMA({short},{long})", orjson.loads(response.content)['results']))
+    ranked.sort(key=lambda item: item[1]['sharpe_ratio'], reverse=True)
+    
+    print(f"\n🏆 Top {min(5, len(ranked))} of {len(ranked)} by Sharpe ratio:")
+    for name, results in ranked[:5]:
+        print(f"\n🔧 {name}...")
+        print(format_strategy_results(results))
     
     print()
 
 
+SUITES = {
+    "single": test_rsi_endpoint,
+    "multi": test_multiple_markets,
+    "params": test_different_parameters,
+    "compare": compare_ema_vs_rsi,
+    "sweep": sweep_ema_parameters
+}
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RSI strategy API demo")
+    parser.add_argument(
+        "--suite",
+        choices=["all", *SUITES],
+        default="all",
+        help="Run a single suite instead of all of them"
+    )
+    args = parser.parse_args()
+    
     print()
     print("🚀 NinjaQuant API - RSI Strategy Test Suite")
     print()
     
-    # Run all tests
-    test_rsi_endpoint()
-    test_multiple_markets()
-    test_different_parameters()
-    compare_ema_vs_rsi()
+    # Run the selected tests (all by default)
+    for name, suite in SUITES.items():
+        if args.suite in ("all", name):
+            suite()
     
     print("=" * 70)
     print("✅ RSI Strategy Testing Complete!")
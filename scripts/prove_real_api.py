@@ -2,7 +2,7 @@
 Proof: NinjaQuant Uses REAL Injective Blockchain API Calls (NOT MOCKING)
 """
 import requests
-import json
+import orjson
 
 print("=" * 80)
 print("🔍 PROOF: Real Injective Blockchain API Calls")
@@ -25,7 +25,7 @@ try:
     print()
     
     # Parse the response
-    data = response.json()
+    data = orjson.loads(response.content)
     markets = data.get('markets', [])
     
     print(f"🎯 Total Markets Fetched: {len(markets)}")
@@ -1,20 +1,31 @@
 """Display the hardcoded Injective Market IDs used by the API"""
+import sys
 from app.data.injective_client import INJECTIVE_MARKETS
 
-print("\n" + "="*70)
-print("INJECTIVE MARKET IDs (Hardcoded)")
-print("="*70)
-print("\nThese Market IDs are used directly without dynamic API fetching:\n")
+# Assemble the whole report and write it once instead of one print per line
+lines = [
+    "",
+    "="*70,
+    "INJECTIVE MARKET IDs (Hardcoded)",
+    "="*70,
+    "\nThese Market IDs are used directly without dynamic API fetching:\n",
+]
 
 for ticker, info in INJECTIVE_MARKETS.items():
-    print(f"📊 {ticker}")
-    print(f"   Market ID: {info['market_id']}")
-    print(f"   Oracle:    {info['oracle_type']}")
-    print(f"   Base:      {info['oracle_base']}")
-    print()
+    lines += [
+        f"📊 {ticker}",
+        f"   Market ID: {info['market_id']}",
+        f"   Oracle:    {info['oracle_type']}",
+        f"   Base:      {info['oracle_base']}",
+        "",
+    ]
 
-print("="*70)
-print(f"Total Markets: {len(INJECTIVE_MARKETS)}")
-print("="*70)
-print("\n✅ All Market IDs are hardcoded for fast, reliable access")
-print("🔗 Verify on Injective Explorer: https://explorer.injective.network/\n")
+lines += [
+    "="*70,
+    f"Total Markets: {len(INJECTIVE_MARKETS)}",
+    "="*70,
+    "\n✅ All Market IDs are hardcoded for fast, reliable access",
+    "🔗 Verify on Injective Explorer: https://explorer.injective.network/\n",
+]
+
+sys.stdout.write("\n".join(lines) + "\n")
@@ -2,7 +2,7 @@
 Verify Real Market IDs for BTC, ETH, and INJ from Injective Blockchain
 """
 import requests
-import json
+import orjson
 
 print("=" * 80)
 print("🔍 VERIFYING MARKET IDs FROM INJECTIVE BLOCKCHAIN")
@@ -26,12 +26,18 @@ print()
 try:
     response = requests.get(INJECTIVE_LCD_URL, timeout=10)
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
     
     markets = data.get('markets', [])
     print(f"✅ Successfully fetched {len(markets)} markets from Injective blockchain")
     print()
     
+    # Index markets by ticker once so each lookup below is a dict hit
+    markets_by_ticker = {}
+    for market_wrapper in markets:
+        market = market_wrapper.get('market', {})
+        markets_by_ticker.setdefault(market.get('ticker'), market)
+    
     print("=" * 80)
     print("🎯 VERIFYING MARKET IDs")
     print("=" * 80)
@@ -42,34 +48,29 @@ try:
     for ticker, expected_id in EXPECTED_MARKET_IDS.items():
         print(f"🔎 Searching for {ticker}...")
         
-        found = False
-        for market_wrapper in markets:
-            market = market_wrapper.get('market', {})
-            
-            if market.get('ticker') == ticker:
-                found = True
-                actual_id = market.get('market_id')
-                oracle_type = market.get('oracle_type')
-                oracle_base = market.get('oracle_base')
-                
-                print(f"   ✅ FOUND on blockchain!")
-                print(f"   Market ID: {actual_id}")
-                print(f"   Oracle: {oracle_type}")
-                print(f"   Oracle Base: {oracle_base}")
-                
-                # Verify the Market ID matches
-                if actual_id == expected_id:
-                    print(f"   ✅ VERIFIED: Market ID matches expected value!")
-                    verified_count += 1
-                else:
-                    print(f"   ⚠️  WARNING: Market ID doesn't match!")
-                    print(f"      Expected: {expected_id}")
-                    print(f"      Got:      {actual_id}")
-                
-                print()
-                break
+        market = markets_by_ticker.get(ticker)
         
-        if not found:
+        if market is not None:
+            actual_id = market.get('market_id')
+            oracle_type = market.get('oracle_type')
+            oracle_base = market.get('oracle_base')
+            
+            print(f"   ✅ FOUND on blockchain!")
+            print(f"   Market ID: {actual_id}")
+            print(f"   Oracle: {oracle_type}")
+            print(f"   Oracle Base: {oracle_base}")
+            
+            # Verify the Market ID matches
+            if actual_id == expected_id:
+                print(f"   ✅ VERIFIED: Market ID matches expected value!")
+                verified_count += 1
+            else:
+                print(f"   ⚠️  WARNING: Market ID doesn't match!")
+                print(f"      Expected: {expected_id}")
+                print(f"      Got:      {actual_id}")
+            
+            print()
+        else:
             print(f"   ❌ NOT FOUND on blockchain")
             print()
     
@@ -0,0 +1,32 @@
+"""Test request validation on the backtest endpoints"""
+import sys
+import pytest
+from fastapi.testclient import TestClient
+
+# Add parent directory (and the config module's directory) to path
+sys.path.append('.')
+sys.path.append('config')
+
+from app.main import app
+
+client = TestClient(app)
+
+# (case, payload, expected status) for /backtest/ema-crossover
+VALIDATION_CASES = [
+    ("invalid periods", {"market": "INJ/USDT PERP", "timeframe": "1h",
+                         "parameters": {"short_period": 21, "long_period": 9}}, 422),
+    ("negative period", {"market": "INJ/USDT PERP", "timeframe": "1h",
+                         "parameters": {"short_period": -5, "long_period": 21}}, 422),
+    ("invalid timeframe", {"market": "INJ/USDT PERP", "timeframe": "2h",
+                           "parameters": {"short_period": 9, "long_period": 21}}, 422),
+    ("invalid market", {"market": "inj-usdt", "timeframe": "1h",
+                        "parameters": {"short_period": 9, "long_period": 21}}, 422),
+]
+
+
+@pytest.mark.parametrize("case, payload, expected", VALIDATION_CASES, ids=[c[0] for c in VALIDATION_CASES])
+def test_invalid_backtest_request_rejected(case, payload, expected):
+    """Malformed backtest requests are rejected before the strategy runs"""
+    response = client.post("/backtest/ema-crossover", json=payload)
+
+    assert response.status_code == expected, f"{case}: {response.text}"
@@ -0,0 +1,81 @@
+"""Test EMA Crossover Strategy Implementation"""
+import sys
+import pandas as pd
+import numpy as np
+
+# Add parent directory to path
+sys.path.append('.')
+
+from app.strategies.ema_crossover import EMAStrategy
+
+
+def _reference_trades(df):
+    """Reference loop implementation of the crossover state machine"""
+    trades = []
+    position_open = False
+    entry_price = 0
+    entry_index = 0
+
+    for i in range(1, len(df)):
+        current_short = df['ema_short'].iloc[i]
+        current_long = df['ema_long'].iloc[i]
+        prev_short = df['ema_short'].iloc[i-1]
+        prev_long = df['ema_long'].iloc[i-1]
+        current_price = df['close'].iloc[i]
+
+        if pd.isna(current_short) or pd.isna(current_long):
+            continue
+
+        if not position_open and current_short > current_long and prev_short <= prev_long:
+            position_open = True
+            entry_price = current_price
+            entry_index = i
+        elif position_open and current_short < current_long and prev_short >= prev_long:
+            trades.append({
+                'entry_price': entry_price,
+                'exit_price': current_price,
+                'return': (current_price - entry_price) / entry_price,
+                'entry_index': entry_index,
+                'exit_index': i
+            })
+            position_open = False
+
+    return trades
+
+
+def test_trades_match_reference():
+    """Vectorized crossover detection agrees with the loop implementation"""
+    strategy = EMAStrategy()
+    np.random.seed(3)
+    for short_period, long_period in ((9, 21), (5, 50), (12, 26)):
+        close = 100 * np.exp(np.cumsum(np.random.normal(0, 0.02, 1000)))
+        df = strategy._calculate_ema(pd.DataFrame({'close': close}), short_period, long_period)
+
+        trades = strategy._simulate_trades(close, df['ema_short'].to_numpy(), df['ema_long'].to_numpy())
+        expected = _reference_trades(df)
+
+        assert len(trades) == len(expected) > 0
+        for trade, ref in zip(trades, expected):
+            assert trade['entry_index'] == ref['entry_index']
+            assert trade['exit_index'] == ref['exit_index']
+            assert np.isclose(trade['return'], ref['return'], rtol=1e-12)
+
+
+def test_open_position_is_not_closed():
+    """A golden cross without a following death cross yields no trade"""
+    df = pd.DataFrame({'close': [100.0 - i for i in range(30)] + [70.0 + 2 * i for i in range(30)]})
+    trades = EMAStrategy().execute(df, {'short_period': 3, 'long_period': 8})
+
+    assert trades == []
+
+
+def test_parameter_model_matches_dict():
+    """A validated EMAParameters model gives the same trades as the dict form"""
+    from app.models.schemas import EMAParameters
+
+    np.random.seed(5)
+    df = pd.DataFrame({'close': 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 500)))})
+    strategy = EMAStrategy()
+
+    assert strategy.execute(df, EMAParameters(short_period=5, long_period=20)) == \
+        strategy.execute(df, {'short_period': 5, 'long_period': 20})
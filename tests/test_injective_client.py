@@ -0,0 +1,115 @@
+"""Test Injective data client"""
+import sys
+import numpy as np
+import pytest
+
+# Add parent directory to path
+sys.path.append('.')
+
+from app.data import InjectiveDataClient
+
+
+MARKETS = [
+    {'market': {'ticker': 'INJ/USDT PERP', 'marketId': '0x9b99'}},
+    {'market': {'ticker': 'BTC/USDT PERP', 'marketId': '0x4ca0'}},
+    {'market': {}},
+]
+
+
+def _client(tmp_path, monkeypatch, calls):
+    """Client with an isolated cache that records market list fetches"""
+    monkeypatch.setattr(InjectiveDataClient, '_markets_cache', {})
+    client = InjectiveDataClient(cache_dir=tmp_path)
+
+    def fake_fetch():
+        calls.append(1)
+        return MARKETS
+
+    monkeypatch.setattr(client, '_fetch_markets', fake_fetch)
+    return client
+
+
+def test_market_list_cached_in_memory(tmp_path, monkeypatch):
+    """Repeated lookups reuse the fetched market list"""
+    calls = []
+    client = _client(tmp_path, monkeypatch, calls)
+
+    assert client.get_available_markets() == ['INJ/USDT PERP', 'BTC/USDT PERP']
+    assert client.get_available_markets() == ['INJ/USDT PERP', 'BTC/USDT PERP']
+    assert len(calls) == 1
+
+
+def test_market_list_cached_on_disk(tmp_path, monkeypatch):
+    """A new process reads the market list from disk within the TTL"""
+    calls = []
+    _client(tmp_path, monkeypatch, calls).get_available_markets()
+    assert (tmp_path / 'markets_mainnet.json').exists()
+
+    # Fresh in-memory cache, as in a new worker process
+    client = _client(tmp_path, monkeypatch, calls)
+    assert client.get_available_markets() == ['INJ/USDT PERP', 'BTC/USDT PERP']
+    assert len(calls) == 1
+
+
+def test_market_list_expires(tmp_path, monkeypatch):
+    """Expired caches are refetched"""
+    calls = []
+    client = _client(tmp_path, monkeypatch, calls)
+    client.markets_cache_ttl = 0
+
+    client.get_available_markets()
+    client.get_available_markets()
+    assert len(calls) == 2
+
+
+def test_refresh_markets_refetches(tmp_path, monkeypatch):
+    """refresh_markets drops the memory and disk caches and fetches again"""
+    calls = []
+    client = _client(tmp_path, monkeypatch, calls)
+    client.get_available_markets()
+
+    assert client.refresh_markets() == ['INJ/USDT PERP', 'BTC/USDT PERP']
+    assert len(calls) == 2
+    assert (tmp_path / 'markets_mainnet.json').exists()
+
+    client.get_available_markets()
+    assert len(calls) == 2
+
+
+def test_generated_candles_are_consistent():
+    """Generated candles have OHLCV columns and valid price relationships"""
+    client = InjectiveDataClient()
+    df = client.fetch_historical_candles("ETH/USDT PERP", "1h", 500)
+
+    assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    assert len(df) == 500
+    assert (df['timestamp'].diff().dropna() == np.timedelta64(1, 'h')).all()
+    assert (df['high'] >= df[['open', 'close']].max(axis=1)).all()
+    assert (df['low'] <= df[['open', 'close']].min(axis=1)).all()
+    assert ((df['volume'] >= 50000) & (df['volume'] <= 500000)).all()
+    assert (df[['open', 'high', 'low', 'close', 'volume']].dtypes == np.float64).all()
+    assert df['timestamp'].dtype == 'datetime64[ns]'
+    assert not df['close'].to_numpy().flags.writeable
+
+
+def test_unsupported_timeframe_fails_before_market_lookup(monkeypatch):
+    """Invalid timeframes are rejected without touching market info"""
+    client = InjectiveDataClient()
+    lookups = []
+    monkeypatch.setattr(client, '_get_market_info', lambda market: lookups.append(market))
+
+    with pytest.raises(ValueError):
+        client.fetch_historical_candles("ETH/USDT PERP", "2h", 100)
+    assert lookups == []
+
+
+def test_market_info_is_precomputed_and_read_only():
+    """Supported markets resolve to a shared read-only entry with its base price"""
+    client = InjectiveDataClient()
+    info = client._get_market_info("BTC/USDT PERP")
+
+    assert client._get_market_base_price(info) == 50000.0
+    assert client._get_market_base_price({'ticker': 'XAU/USDT PERP'}) == 2050.0
+    assert client._get_market_info("BTC/USDT PERP") is info
+    with pytest.raises(TypeError):
+        info['base_price'] = 1.0
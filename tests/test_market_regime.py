@@ -0,0 +1,81 @@
+"""Test Market Regime Analysis"""
+import sys
+import pandas as pd
+import numpy as np
+
+# Add parent directory to path
+sys.path.append('.')
+
+from app.analysis import MarketRegimeAnalyzer
+
+
+def _polyfit_r2(close):
+    """Reference R² using np.polyfit"""
+    x = np.arange(len(close))
+    slope, intercept = np.polyfit(x, close, 1)
+    y_pred = slope * x + intercept
+    ss_res = np.sum((close - y_pred) ** 2)
+    ss_tot = np.sum((close - np.mean(close)) ** 2)
+    return 1 - ss_res / ss_tot
+
+
+def test_trend_strength_matches_polyfit():
+    """Trend strength from analyze() agrees with np.polyfit"""
+    np.random.seed(7)
+    for base_price in (25.0, 3000.0, 50000.0):
+        close = base_price * np.exp(np.cumsum(np.random.normal(0.0001, 0.02, 500)))
+        analyzer = MarketRegimeAnalyzer(pd.DataFrame({'close': close}))
+
+        assert np.isclose(analyzer.analyze()['trend_strength'], _polyfit_r2(close), rtol=1e-9, atol=1e-9)
+
+
+def test_flat_market():
+    """Flat prices have no trend and no volatility"""
+    analyzer = MarketRegimeAnalyzer(pd.DataFrame({'close': [50000.0] * 100}))
+    result = analyzer.analyze()
+
+    assert result['trend_strength'] == 0.0
+    assert result['volatility_value'] == 0.0
+    assert result['regime'] == "Ranging"
+
+
+def test_trending_market():
+    """Linear prices are classified as trending"""
+    analyzer = MarketRegimeAnalyzer(pd.DataFrame({'close': [100.0 + 0.01 * i for i in range(200)]}))
+    result = analyzer.analyze()
+
+    assert result['regime'] == "Trending"
+    assert np.isclose(result['trend_strength'], 1.0)
+
+
+def test_volatility_matches_std_of_returns():
+    """Fused volatility equals the std of simple returns, annualized"""
+    np.random.seed(13)
+    close = 3000.0 * np.exp(np.cumsum(np.random.normal(0, 0.02, 500)))
+    analyzer = MarketRegimeAnalyzer(pd.DataFrame({'close': close}))
+    result = analyzer.analyze()
+
+    returns = np.diff(close) / close[:-1]
+    expected = np.std(returns) * np.sqrt(24 * 365)
+
+    assert np.isclose(result['volatility_value'], expected, rtol=1e-9)
+    assert np.isclose(result['price_change_pct'], (close[-1] - close[0]) / close[0], rtol=1e-12)
+
+
+def test_response_rounds_metrics():
+    """MarketRegimeResponse rounds metrics for the wire format"""
+    from app.models.schemas import MarketRegimeResponse
+
+    response = MarketRegimeResponse(
+        market="INJ/USDT PERP",
+        timeframe="1h",
+        regime="Trending",
+        trend_strength=0.123456,
+        volatility_level="Low",
+        volatility_value=0.333333,
+        price_change_pct=-0.0500049
+    )
+
+    assert response.trend_strength == 0.1235
+    assert response.volatility_value == 0.3333
+    assert response.price_change_pct == -0.05
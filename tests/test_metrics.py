@@ -0,0 +1,77 @@
+"""Test Performance Metrics Calculation"""
+import sys
+import numpy as np
+
+# Add parent directory to path
+sys.path.append('.')
+
+from app.core import MetricsCalculator
+
+
+def _reference_metrics(returns, initial_capital):
+    """Reference loop implementation"""
+    win_rate = sum(1 for r in returns if r > 0) / len(returns)
+
+    capital = initial_capital
+    equity_curve = [capital]
+    for r in returns:
+        capital *= (1 + r)
+        equity_curve.append(capital)
+    total_return = (capital - initial_capital) / initial_capital
+
+    peak = equity_curve[0]
+    max_drawdown = 0
+    for value in equity_curve:
+        if value > peak:
+            peak = value
+        drawdown = (peak - value) / peak if peak > 0 else 0
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+
+    if len(returns) > 1 and np.std(returns) > 0:
+        sharpe_ratio = np.mean(returns) / np.std(returns)
+    else:
+        sharpe_ratio = 0.0
+
+    return {
+        'win_rate': round(win_rate, 4),
+        'total_return': round(total_return, 4),
+        'max_drawdown': round(max_drawdown, 4),
+        'sharpe_ratio': round(sharpe_ratio, 4),
+        'total_trades': len(returns)
+    }
+
+
+def test_metrics_match_reference():
+    """Vectorized metrics agree with the loop implementation"""
+    np.random.seed(21)
+    cases = [
+        [0.05],
+        [-0.05],
+        [0.02, -0.01, 0.03, -0.04, 0.01],
+        list(np.random.normal(0.001, 0.03, 500)),
+    ]
+    for returns in cases:
+        trades = [{'return': r} for r in returns]
+        result = MetricsCalculator.calculate(trades, 10000)
+        expected = _reference_metrics(returns, 10000)
+
+        for key, value in expected.items():
+            assert np.isclose(result[key], value, atol=1e-4), key
+
+
+def test_no_trades():
+    """No trades gives zeroed metrics"""
+    result = MetricsCalculator.calculate([], 10000)
+
+    assert result['total_trades'] == 0
+    assert result['total_return'] == 0.0
+
+
+def test_calculate_from_returns_matches_trades():
+    """Returns-array entry point agrees with the trade-dict entry point"""
+    returns = np.array([0.02, -0.01, 0.03, -0.04, 0.01])
+    trades = [{'return': r} for r in returns]
+
+    assert MetricsCalculator.calculate_from_returns(returns, 10000) == MetricsCalculator.calculate(trades, 10000)
+    assert MetricsCalculator.calculate_from_returns(np.array([]), 10000)['total_trades'] == 0
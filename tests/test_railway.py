@@ -6,14 +6,34 @@ Example: https://ninjaquant-production.up.railway.app
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 
 # ⚠️ REPLACE THIS with your Railway URL
 RAILWAY_URL = "https://your-app-name.up.railway.app"
 
+# One keep-alive session so every check reuses the same TLS connection
+SESSION = requests.Session()
+# Concurrent calls wait for a pooled connection instead of opening extra sockets
+SESSION.mount("https://", HTTPAdapter(pool_maxsize=10, pool_block=True))
+
+def railway_url_configured() -> bool:
+    """Check RAILWAY_URL points at a real deployment, without any network I/O"""
+    parsed = urlparse(RAILWAY_URL)
+    host = parsed.netloc.lower()
+    if parsed.scheme not in ("http", "https") or not host:
+        return False
+    return "your-app-name" not in host and "example" not in host
+
 def test_railway_api():
     """Test the deployed API on Railway"""
     
+    if not railway_url_configured():
+        print(f"⚠️ RAILWAY_URL is not configured ({RAILWAY_URL}); skipping Railway checks")
+        return
+    
     print("🚂 Testing NinjaQuant API on Railway")
     print("=" * 60)
     print(f"API URL: {RAILWAY_URL}")
@@ -23,9 +43,9 @@ def test_railway_api():
     # Test 1: Root endpoint
     print("1️⃣ Testing Root Endpoint...")
     try:
-        response = requests.get(f"{RAILWAY_URL}/", timeout=10)
+        response = SESSION.get(f"{RAILWAY_URL}/", timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             print(f"✅ Status: {response.status_code}")
             print(f"✅ API Version: {data.get('version')}")
             print(f"✅ Data Mode: {data.get('data_mode').upper()}")
@@ -40,10 +60,48 @@ def test_railway_api():
     
     print()
     
+    # The root check gates the rest; the remaining checks are independent,
+    # so send them together and report them in order as they complete
+    inj_payload = {
+        "market": "INJ/USDT PERP",
+        "timeframe": "1h",
+        "parameters": {
+            "short_period": 12,
+            "long_period": 26
+        },
+        "initial_capital": 10000
+    }
+    btc_payload = {
+        "market": "BTC/USDT PERP",
+        "timeframe": "1h",
+        "parameters": {
+            "short_period": 9,
+            "long_period": 21
+        }
+    }
+    
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        docs_future = pool.submit(SESSION.get, f"{RAILWAY_URL}/docs", timeout=10)
+        inj_future = pool.submit(SESSION.post, f"{RAILWAY_URL}/backtest/ema-crossover", json=inj_payload, timeout=30)
+        btc_future = pool.submit(SESSION.post, f"{RAILWAY_URL}/backtest/ema-crossover", json=btc_payload, timeout=30)
+        report_concurrent_checks(docs_future, inj_future, btc_future)
+    
+    print("=" * 60)
+    print("🎉 Testing Complete!")
+    print("=" * 60)
+    print(f"\n📝 Your API Links:")
+    print(f"   Homepage: {RAILWAY_URL}/")
+    print(f"   API Docs: {RAILWAY_URL}/docs")
+    print(f"   Redoc: {RAILWAY_URL}/redoc")
+    print()
+
+
+def report_concurrent_checks(docs_future, inj_future, btc_future):
+    """Print the docs and backtest checks from their in-flight requests"""
     # Test 2: API Documentation
     print("2️⃣ Testing API Docs...")
     try:
-        response = requests.get(f"{RAILWAY_URL}/docs", timeout=10)
+        response = docs_future.result()
         if response.status_code == 200:
             print(f"✅ Docs available at: {RAILWAY_URL}/docs")
         else:
@@ -56,25 +114,11 @@ def test_railway_api():
     # Test 3: Backtest with INJ/USDT PERP
     print("3️⃣ Testing Backtest - INJ/USDT PERP...")
     try:
-        payload = {
-            "market": "INJ/USDT PERP",
-            "timeframe": "1h",
-            "parameters": {
-                "short_period": 12,
-                "long_period": 26
-            },
-            "initial_capital": 10000
-        }
-        
-        print(f"   Sending request to: {RAILWAY_URL}/backtest/ema-crossover")
-        response = requests.post(
-            f"{RAILWAY_URL}/backtest/ema-crossover",
-            json=payload,
-            timeout=30
-        )
+        print(f"   Sent request to: {RAILWAY_URL}/backtest/ema-crossover")
+        response = inj_future.result()
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Status: {response.status_code}")
             print(f"✅ Strategy: {result['strategy']}")
             print(f"✅ Market: {result['market']}")
@@ -95,23 +139,10 @@ def test_railway_api():
     # Test 4: Backtest with BTC/USDT PERP
     print("4️⃣ Testing Backtest - BTC/USDT PERP...")
     try:
-        payload = {
-            "market": "BTC/USDT PERP",
-            "timeframe": "1h",
-            "parameters": {
-                "short_period": 9,
-                "long_period": 21
-            }
-        }
-        
-        response = requests.post(
-            f"{RAILWAY_URL}/backtest/ema-crossover",
-            json=payload,
-            timeout=30
-        )
+        response = btc_future.result()
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"✅ Status: {response.status_code}")
             print(f"✅ Market: {result['market']}")
             print(f"\n📊 Results:")
@@ -124,19 +155,11 @@ def test_railway_api():
         print(f"❌ Error: {e}")
     
     print()
-    print("=" * 60)
-    print("🎉 Testing Complete!")
-    print("=" * 60)
-    print(f"\n📝 Your API Links:")
-    print(f"   Homepage: {RAILWAY_URL}/")
-    print(f"   API Docs: {RAILWAY_URL}/docs")
-    print(f"   Redoc: {RAILWAY_URL}/redoc")
-    print()
 
 
 if __name__ == "__main__":
     # Check if URL is set
-    if "your-app-name" in RAILWAY_URL.lower() or "example" in RAILWAY_URL.lower():
+    if not railway_url_configured():
         print("❌ ERROR: Please update RAILWAY_URL with your actual Railway deployment URL!")
         print("\n📍 To find your Railway URL:")
         print("   1. Go to railway.app dashboard")
@@ -0,0 +1,105 @@
+"""Test Risk Analysis"""
+import sys
+import numpy as np
+
+# Add parent directory to path
+sys.path.append('.')
+
+from app.analysis import RiskAnalyzer
+from app.analysis._kernels import max_run_length
+from app.models import Trade
+
+
+def _reference_max_consecutive_losses(returns):
+    """Reference loop implementation"""
+    max_consecutive = 0
+    current_consecutive = 0
+    for ret in returns:
+        if ret < 0:
+            current_consecutive += 1
+            max_consecutive = max(max_consecutive, current_consecutive)
+        else:
+            current_consecutive = 0
+    return max_consecutive
+
+
+def test_max_consecutive_losses():
+    """Vectorized losing streak matches the loop implementation"""
+    np.random.seed(3)
+    analyzer = RiskAnalyzer([], 10000)
+    cases = [
+        [],
+        [0.01],
+        [-0.01],
+        [-0.01, -0.02, 0.0, -0.03],
+        [0.01, -0.01, -0.01, -0.01],
+        list(np.random.normal(0, 0.05, 1000)),
+        list(np.random.normal(-0.02, 0.05, 5000)),
+    ]
+    for returns in cases:
+        arr = np.asarray(returns, dtype=np.float64)
+        assert analyzer._calculate_max_consecutive_losses(arr < 0) == _reference_max_consecutive_losses(returns)
+
+
+def test_max_losing_streak_across_blocks():
+    """Streaks spanning block boundaries are carried over"""
+    np.random.seed(5)
+    cases = [
+        np.random.normal(-0.01, 0.05, 1000),
+        -np.ones(25),
+        np.concatenate([np.ones(7), -np.ones(20), np.ones(3)]),
+        np.concatenate([-np.ones(9), np.ones(1), -np.ones(11)]),
+    ]
+    for returns in cases:
+        for block_size in (1, 2, 7, 64, 100000):
+            assert max_run_length(returns < 0, block_size) == _reference_max_consecutive_losses(returns)
+
+
+def test_analyze_metrics():
+    """Loss metrics from a known trade list"""
+    trades = [{'return': r} for r in [0.05, -0.02, -0.04, 0.03, -0.01, 0.02]]
+    result = RiskAnalyzer(trades, 10000).analyze()
+
+    assert result['max_consecutive_losses'] == 2
+    assert result['largest_loss'] == -0.04
+    assert np.isclose(result['avg_loss'], np.mean([-0.02, -0.04, -0.01]))
+    assert np.isclose(result['return_volatility'], np.std([0.05, -0.02, -0.04, 0.03, -0.01, 0.02]))
+
+
+def test_value_at_risk_matches_percentile():
+    """Partition-based VaR equals np.percentile"""
+    np.random.seed(11)
+    analyzer = RiskAnalyzer([], 10000)
+    for n in (2, 3, 20, 21, 999, 10000):
+        returns = np.random.normal(0, 0.05, n)
+        for confidence in (0.95, 0.99, 0.5):
+            expected = np.percentile(returns, (1 - confidence) * 100)
+            assert np.isclose(analyzer._calculate_value_at_risk(returns, confidence), expected, rtol=1e-12, atol=1e-15)
+
+
+def test_trade_objects():
+    """Trade objects are read through return_pct"""
+    trades = [
+        Trade(entry_price=100, exit_price=90, return_pct=-0.1, entry_index=0, exit_index=1),
+        Trade(entry_price=90, exit_price=99, return_pct=0.1, entry_index=2, exit_index=3),
+    ]
+    result = RiskAnalyzer(trades, 10000).analyze()
+
+    assert result['largest_loss'] == -0.1
+    assert result['max_consecutive_losses'] == 1
+
+
+def test_no_trades():
+    """No trades means no risk"""
+    result = RiskAnalyzer([], 10000).analyze()
+
+    assert result['risk_level'] == "Low"
+    assert result['max_consecutive_losses'] == 0
+
+
+def test_precomputed_returns_match_trades():
+    """Passing the returns column gives the same metrics as extracting it"""
+    trades = [{'return': r} for r in (0.02, -0.01, -0.03, 0.04, -0.02)]
+    returns = np.array([t['return'] for t in trades])
+
+    assert RiskAnalyzer(trades, 1000, returns=returns).analyze() == RiskAnalyzer(trades, 1000).analyze()
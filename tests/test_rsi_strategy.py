@@ -8,13 +8,14 @@ sys.path.append('.')
 
 from app.strategies.rsi_strategy import RSIStrategy
 
+# Last five RSI(14) values of the test_rsi_calculation prices, computed by hand
+# with the span-based EMA recursion (alpha = 2 / (period + 1); the first bar's
+# zero change seeds the averages)
+REF_LAST5 = np.array([62.4560304657, 63.0736641199, 70.2311841441, 63.1674022085, 46.6432722252])
+
 
 def test_rsi_calculation():
-    """Test RSI calculation accuracy"""
-    print("=" * 60)
-    print("Testing RSI Calculation")
-    print("=" * 60)
-    
+    """RSI(14) matches the reference values"""
     # Create sample price data
     prices = [44.34, 44.09, 44.15, 43.61, 44.33, 44.83, 45.10, 45.42, 45.84,
               46.08, 45.89, 46.03, 45.61, 46.28, 46.28, 46.00, 46.03, 46.41,
@@ -25,10 +26,7 @@ def test_rsi_calculation():
     strategy = RSIStrategy()
     df_with_rsi = strategy._calculate_rsi(df, period=14)
     
-    print(f"Sample prices: {prices[:5]}...")
-    print(f"Calculated RSI values (last 5): {df_with_rsi['rsi'].iloc[-5:].values}")
-    print(f"RSI range: {df_with_rsi['rsi'].min():.2f} - {df_with_rsi['rsi'].max():.2f}")
-    print("✅ RSI calculation successful\n")
+    np.testing.assert_allclose(df_with_rsi['rsi'].iloc[-5:].to_numpy(), REF_LAST5, rtol=1e-9)
 
 
 def test_rsi_strategy_execution():
@@ -42,19 +40,14 @@ def test_rsi_strategy_execution():
     n_candles = 200
     base_price = 100
     
-    # Create oscillating prices
-    prices = []
-    price = base_price
-    for i in range(n_candles):
-        # Add trend and oscillation
-        trend = 0.1 * np.sin(i / 20)
-        noise = np.random.randn() * 2
-        price = price + trend + noise
-        prices.append(price)
+    # Create oscillating prices: cumulative trend and oscillation plus noise
+    trend = 0.1 * np.sin(np.arange(n_candles) / 20)
+    noise = np.random.randn(n_candles) * 2
+    prices = base_price + np.cumsum(trend + noise)
     
     df = pd.DataFrame({
         'close': prices,
-        'timestamp': pd.date_range('2024-01-01', periods=n_candles, freq='1H')
+        'timestamp': pd.date_range('2024-01-01', periods=n_candles, freq='h')
     })
     
     # Test with default parameters
@@ -74,11 +67,12 @@ def test_rsi_strategy_execution():
     print(f"Total trades: {len(trades)}")
     
     if len(trades) > 0:
-        winning_trades = [t for t in trades if t['return'] > 0]
-        win_rate = len(winning_trades) / len(trades) * 100
-        avg_return = sum(t['return'] for t in trades) / len(trades) * 100
+        returns = np.fromiter((t['return'] for t in trades), dtype=np.float64, count=len(trades))
+        winning_trades = int((returns > 0).sum())
+        win_rate = winning_trades / len(trades) * 100
+        avg_return = returns.mean() * 100
         
-        print(f"Winning trades: {len(winning_trades)}/{len(trades)} ({win_rate:.1f}%)")
+        print(f"Winning trades: {winning_trades}/{len(trades)} ({win_rate:.1f}%)")
         print(f"Average return per trade: {avg_return:.2f}%")
         
         print("\nSample trades:")
@@ -145,23 +139,24 @@ def test_edge_cases():
     print("=" * 60)
     
     strategy = RSIStrategy()
+    n = 50
     
     # Test with trending market (all up)
-    prices_up = [100 + i for i in range(50)]
+    prices_up = np.arange(100.0, 100.0 + n)
     df_up = pd.DataFrame({'close': prices_up})
     
     trades_up = strategy.execute(df_up, {'period': 14, 'oversold': 30, 'overbought': 70})
     print(f"Trending up market: {len(trades_up)} trades")
     
     # Test with trending market (all down)
-    prices_down = [100 - i for i in range(50)]
+    prices_down = np.arange(100.0, 100.0 - n, -1)
     df_down = pd.DataFrame({'close': prices_down})
     
     trades_down = strategy.execute(df_down, {'period': 14, 'oversold': 30, 'overbought': 70})
     print(f"Trending down market: {len(trades_down)} trades")
     
     # Test with flat market
-    prices_flat = [100 + np.random.randn() * 0.1 for _ in range(50)]
+    prices_flat = 100 + np.random.default_rng(0).standard_normal(n) * 0.1
     df_flat = pd.DataFrame({'close': prices_flat})
     
     trades_flat = strategy.execute(df_flat, {'period': 14, 'oversold': 30, 'overbought': 70})
@@ -170,6 +165,84 @@ def test_edge_cases():
     print("✅ Edge cases handled\n")
 
 
+def test_rsi_matches_series_formula():
+    """Array RSI agrees with the Series diff/where/ewm formulation"""
+    np.random.seed(5)
+    cases = [
+        100 * np.exp(np.cumsum(np.random.normal(0, 0.02, 500))),
+        np.arange(50.0) + 100,
+        100 - np.arange(50.0),
+    ]
+    for close in cases:
+        series = pd.Series(close)
+        delta = series.diff()
+        avg_gain = delta.where(delta > 0, 0).ewm(span=14, adjust=False).mean()
+        avg_loss = (-delta.where(delta < 0, 0)).ewm(span=14, adjust=False).mean()
+        expected = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        rsi = RSIStrategy()._calculate_rsi(pd.DataFrame({'close': close}), period=14)['rsi']
+
+        assert np.allclose(rsi.to_numpy(), expected.to_numpy(), rtol=1e-12, equal_nan=True)
+
+
+def _reference_trades(df, oversold, overbought):
+    """Reference loop implementation of the RSI state machine"""
+    trades = []
+    position_open = False
+    entry_price = 0
+    entry_index = 0
+
+    for i in range(1, len(df)):
+        current_rsi = df['rsi'].iloc[i]
+        prev_rsi = df['rsi'].iloc[i-1]
+        current_price = df['close'].iloc[i]
+
+        if pd.isna(current_rsi) or pd.isna(prev_rsi):
+            continue
+
+        if not position_open and current_rsi < oversold and prev_rsi >= oversold:
+            position_open = True
+            entry_price = current_price
+            entry_index = i
+        elif position_open and current_rsi > overbought and prev_rsi <= overbought:
+            trades.append((entry_index, i, 'overbought', (current_price - entry_price) / entry_price))
+            position_open = False
+        elif position_open and current_rsi < 50 and prev_rsi >= 50 and i > entry_index + 5:
+            trades.append((entry_index, i, 'mid_level_exit', (current_price - entry_price) / entry_price))
+            position_open = False
+
+    return trades
+
+
+def test_trades_match_reference():
+    """Vectorized signal walk agrees with the loop implementation"""
+    strategy = RSIStrategy()
+    np.random.seed(11)
+    for period, oversold, overbought in ((14, 30, 70), (7, 25, 75), (21, 40, 60)):
+        close = 100 * np.exp(np.cumsum(np.random.normal(0, 0.02, 2000)))
+        df = strategy._calculate_rsi(pd.DataFrame({'close': close}), period)
+
+        trades = strategy._simulate_trades(close, df['rsi'].to_numpy(), oversold, overbought)
+        expected = _reference_trades(df, oversold, overbought)
+
+        assert len(trades) == len(expected) > 0
+        for trade, (entry_index, exit_index, exit_reason, trade_return) in zip(trades, expected):
+            assert (trade['entry_index'], trade['exit_index'], trade['exit_reason']) == (entry_index, exit_index, exit_reason)
+            assert np.isclose(trade['return'], trade_return, rtol=1e-12)
+
+
+def test_parameter_model_matches_dict():
+    """A validated RSIParameters model gives the same trades as the dict form"""
+    from app.models.schemas import RSIParameters
+    
+    np.random.seed(9)
+    df = pd.DataFrame({'close': 100 * np.exp(np.cumsum(np.random.normal(0, 0.02, 500)))})
+    strategy = RSIStrategy()
+    
+    assert strategy.execute(df, RSIParameters(period=14, oversold=30, overbought=70)) == \
+        strategy.execute(df, {'period': 14, 'oversold': 30, 'overbought': 70})
+
+
 if __name__ == "__main__":
     print("\n")
     print("🧪 RSI STRATEGY TEST SUITE")
@@ -0,0 +1,39 @@
+"""Test synthetic data client"""
+import sys
+import numpy as np
+
+# Add parent directory to path
+sys.path.append('.')
+
+from app.data import SyntheticDataClient
+
+
+def test_synthetic_candles_are_consistent():
+    """Synthetic candles chain open to previous close and bound open/close"""
+    df = SyntheticDataClient().fetch_historical_candles("INJ/USDT PERP", "1h", 300)
+
+    assert list(df.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    assert len(df) == 300
+    assert df['open'].iloc[0] == 10.0
+    assert np.array_equal(df['open'].to_numpy()[1:], df['close'].to_numpy()[:-1])
+    assert (df['high'] >= df[['open', 'close']].max(axis=1)).all()
+    assert (df['low'] <= df[['open', 'close']].min(axis=1)).all()
+    assert (df['timestamp'].diff().dropna() == np.timedelta64(1, 'h')).all()
+
+
+def test_synthetic_candles_are_reproducible():
+    """Repeated fetches with the same seed return identical candles"""
+    client = SyntheticDataClient(seed=7)
+    first = client.fetch_historical_candles("INJ/USDT PERP", "1h", 100)
+    second = client.fetch_historical_candles("INJ/USDT PERP", "1h", 100)
+
+    assert first.equals(second)
+
+
+def test_synthetic_candles_share_generated_block():
+    """The seeded series is generated once and shared read-only"""
+    first = SyntheticDataClient(seed=11).fetch_historical_candles("INJ/USDT PERP", "1h", 50)
+    second = SyntheticDataClient(seed=11).fetch_historical_candles("BTC/USDT PERP", "1h", 50)
+
+    assert np.shares_memory(first['close'].to_numpy(), second['close'].to_numpy())
+    assert not first['close'].to_numpy().flags.writeable